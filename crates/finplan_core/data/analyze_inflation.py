@@ -1,33 +1,21 @@
 #!/usr/bin/env python3
-import csv
-import math
 import sys
 from pathlib import Path
 
+import numpy as np
+
 
 def read_csv_data(filepath):
     """Read data from CSV file."""
-    dates = []
-    values = []
-    with open(filepath, "r", encoding="utf-8-sig") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            dates.append(row["Date"])
-            values.append(float(row["Value"]))
-    return dates, values
-
-
-def mean(data):
-    """Calculate mean of a list."""
-    return sum(data) / len(data)
-
-
-def std_dev(data, sample=True):
-    """Calculate standard deviation of a list."""
-    n = len(data)
-    m = mean(data)
-    variance = sum((x - m) ** 2 for x in data) / (n - 1 if sample else n)
-    return math.sqrt(variance)
+    data = np.loadtxt(
+        filepath,
+        delimiter=",",
+        skiprows=1,
+        quotechar='"',
+        dtype=[("Date", "U10"), ("Value", "f8")],
+        encoding="utf-8-sig",
+    )
+    return data["Date"], data["Value"]
 
 
 def analyze_data(filepath):
@@ -35,8 +23,11 @@ def analyze_data(filepath):
     # Read the data
     dates, raw_values = read_csv_data(filepath)
 
+    # Dates are MM/DD/YYYY; the year is the last field
+    years = np.char.rpartition(dates, "/")[:, 2].astype(np.int64)
+
     # Convert values from percentage to decimal
-    decimal_values = [v / 100 for v in raw_values]
+    decimal_values = raw_values / 100
 
     # Determine data type from filename
     filename = Path(filepath).name.lower()
@@ -62,16 +53,14 @@ def analyze_data(filepath):
     print(f"Data period: {dates[0]} to {dates[-1]}")
     print(f"Number of years: {len(decimal_values)}")
 
-    print(f"Average annual {value_name}: {mean(decimal_values) * 100:.4f}%")
-    print(
-        f"Median annual {value_name}: {sorted(decimal_values)[len(decimal_values) // 2] * 100:.4f}%"
-    )
-    print(f"Minimum {value_name}: {min(decimal_values) * 100:.4f}%")
-    print(f"Maximum {value_name}: {max(decimal_values) * 100:.4f}%")
+    print(f"Average annual {value_name}: {decimal_values.mean() * 100:.4f}%")
+    print(f"Median annual {value_name}: {np.median(decimal_values) * 100:.4f}%")
+    print(f"Minimum {value_name}: {decimal_values.min() * 100:.4f}%")
+    print(f"Maximum {value_name}: {decimal_values.max() * 100:.4f}%")
 
     # Normal Distribution Parameters
-    mean_normal = mean(decimal_values)
-    std_normal = std_dev(decimal_values)
+    mean_normal = decimal_values.mean()
+    std_normal = decimal_values.std(ddof=1)
 
     print(f"\nMean (μ): {mean_normal:.6f} ({mean_normal * 100:.4f}%)")
     print(f"Std Dev (σ): {std_normal:.6f} ({std_normal * 100:.4f}%)")
@@ -80,25 +69,21 @@ def analyze_data(filepath):
     )
 
     # Lognormal Distribution Parameters
-    # For lognormal, we need to transform the data
-    # We add 1 to rates to avoid log of negative numbers
-    # (since 1 + rate represents the growth multiplier)
-    growth_multipliers = [1 + r for r in decimal_values]
+    # For lognormal, we take log(1 + rate) of the growth multiplier;
+    # log1p avoids materializing 1 + rate and is accurate near zero
+    positive_mask = decimal_values > -1.0
+    negative_count = decimal_values.size - positive_mask.sum()
 
-    # Filter out any non-positive values
-    positive_multipliers = [m for m in growth_multipliers if m > 0]
-
-    if len(positive_multipliers) < len(growth_multipliers):
-        negative_count = len(growth_multipliers) - len(positive_multipliers)
+    if negative_count:
         print(
             f"Warning: {negative_count} years had {value_name} < -100% (excluded from lognormal)"
         )
 
     # Calculate lognormal parameters
-    if positive_multipliers:
-        log_values = [math.log(m) for m in positive_multipliers]
-        mu_lognormal = mean(log_values)
-        sigma_lognormal = std_dev(log_values)
+    if positive_mask.any():
+        log_values = np.log1p(decimal_values[positive_mask])
+        mu_lognormal = log_values.mean()
+        sigma_lognormal = log_values.std(ddof=1)
 
         print(f"Lognormal: μ={mu_lognormal:.6f}, σ={sigma_lognormal:.6f}")
     else:
@@ -109,32 +94,29 @@ def analyze_data(filepath):
     print("MODERN ERA ANALYSIS (1950-present)")
     print("=" * 80)
 
-    modern_indices = [i for i, d in enumerate(dates) if d >= "12/31/1950"]
+    modern_values = decimal_values[years >= 1950]
 
-    if not modern_indices:
+    if not modern_values.size:
         print("No data available for modern era (1950-present)")
         return
 
-    modern_values = [decimal_values[i] for i in modern_indices]
-
     print(f"Number of years: {len(modern_values)}")
-    print(f"Average annual {value_name}: {mean(modern_values) * 100:.4f}%")
+    print(f"Average annual {value_name}: {modern_values.mean() * 100:.4f}%")
 
     # Modern Normal Distribution
-    mean_modern_normal = mean(modern_values)
-    std_modern_normal = std_dev(modern_values)
+    mean_modern_normal = modern_values.mean()
+    std_modern_normal = modern_values.std(ddof=1)
     print(
         f"\nNormal: μ={mean_modern_normal:.6f} ({mean_modern_normal * 100:.4f}%), σ={std_modern_normal:.6f} ({std_modern_normal * 100:.4f}%)"
     )
 
     # Modern Lognormal Distribution
-    modern_multipliers = [1 + r for r in modern_values]
-    positive_modern_multipliers = [m for m in modern_multipliers if m > 0]
+    positive_modern_mask = modern_values > -1.0
 
-    if positive_modern_multipliers:
-        log_modern = [math.log(m) for m in positive_modern_multipliers]
-        mu_modern_lognormal = mean(log_modern)
-        sigma_modern_lognormal = std_dev(log_modern)
+    if positive_modern_mask.any():
+        log_modern = np.log1p(modern_values[positive_modern_mask])
+        mu_modern_lognormal = log_modern.mean()
+        sigma_modern_lognormal = log_modern.std(ddof=1)
         print(f"Lognormal: μ={mu_modern_lognormal:.6f}, σ={sigma_modern_lognormal:.6f}")
     else:
         print("Lognormal: Cannot calculate (no positive growth multipliers)")
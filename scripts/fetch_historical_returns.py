@@ -13,19 +13,30 @@ Data Sources (in order of preference):
 Output: Rust const definitions for ReturnProfile presets
 """
 
-import argparse
 import hashlib
+import importlib.util
 import io
 import json
 import os
 import pickle
+import random
+import re
+import shutil
+import sys
+import tempfile
+import threading
+import time
 import zipfile
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
 from datetime import datetime
+from functools import lru_cache, wraps
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Optional
 from urllib.request import urlopen, Request
-from urllib.error import URLError
+from urllib.error import HTTPError, URLError
 
 import numpy as np
 import pandas as pd
@@ -35,29 +46,24 @@ import pandas as pd
 # Environment Loading
 # ============================================================================
 
+# KEY=VALUE with optional single/double quotes and trailing "# comment"
+ENV_LINE = re.compile(
+    r"""^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*"""
+    r"""(?:"([^"\r\n]*)"|'([^'\r\n]*)'|([^\r\n]*?))"""
+    r"""[ \t]*(?:[ \t]#[^\r\n]*)?\r?$""",
+    re.MULTILINE,
+)
+
+
 def load_env_file(env_path: Path) -> dict[str, str]:
     """Load environment variables from a .env file."""
-    env_vars = {}
     if not env_path.exists():
-        return env_vars
-
-    with open(env_path) as f:
-        for line in f:
-            line = line.strip()
-            # Skip comments and empty lines
-            if not line or line.startswith('#'):
-                continue
-            # Parse KEY=VALUE (handle quoted values)
-            if '=' in line:
-                key, _, value = line.partition('=')
-                key = key.strip()
-                value = value.strip()
-                # Remove quotes if present
-                if (value.startswith('"') and value.endswith('"')) or \
-                   (value.startswith("'") and value.endswith("'")):
-                    value = value[1:-1]
-                env_vars[key] = value
-    return env_vars
+        return {}
+
+    return {
+        m.group(1): next(g for g in m.groups()[1:] if g is not None)
+        for m in ENV_LINE.finditer(env_path.read_text())
+    }
 
 
 def load_dotenv():
@@ -90,91 +96,455 @@ def load_dotenv():
 # ============================================================================
 
 CACHE_DIR = Path(__file__).parent / ".data_cache"
-CACHE_MAX_AGE_DAYS = 30  # Re-download data older than this
+STATS_CACHE_DIR = CACHE_DIR / "stats"
+CACHE_MAX_AGE_DAYS = 30  # Default for cache files without a known source
+
+# Re-download data older than this, per source, matched on the cache file
+# name prefix. Academic series update monthly or less; ETF prices daily.
+CACHE_TTL_DAYS = {
+    "shiller": 30,
+    "french": 30,
+    "damodaran": 30,
+    "yahoo": 1,
+    "fred": 7,
+    "results": 1,  # Whole-run snapshot: the shortest source TTL
+}
+
+# Set from --cache-days to use one TTL for every source
+CACHE_DAYS_OVERRIDE: Optional[int] = None
+
+
+def make_cache_dirs() -> None:
+    """
+    Create the cache directories.
+
+    Done once at import (and again after --clear-cache) so the cache
+    writers don't each need a mkdir call.
+    """
+    STATS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+
+make_cache_dirs()
+
+# Fetchers run on a thread pool; cache writes and downloads are serialized
+_CACHE_LOCK = threading.Lock()
+_URL_LOCKS: dict[str, threading.Lock] = {}
+
+
+def synchronized(fn):
+    """
+    Serialize calls to fn so memoized loaders run at most once at a time.
+
+    Stack above @lru_cache: concurrent first callers wait for the one
+    parse instead of each repeating it and racing on its cache file.
+    """
+    lock = threading.Lock()
+
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        with lock:
+            return fn(*args, **kwargs)
+    return wrapper
 
 
-def get_cache_path(url: str, suffix: str = ".pkl") -> Path:
-    """Get cache file path for a URL."""
+def synchronized_per_arg(fn):
+    """
+    Like synchronized, but with one lock per first argument (e.g. per file).
+
+    Concurrent callers for the same argument wait for the one load, while
+    calls for different arguments still run in parallel.
+    """
+    locks: dict = {}
+
+    @wraps(fn)
+    def wrapper(arg, *args, **kwargs):
+        with locks.setdefault(arg, threading.Lock()):
+            return fn(arg, *args, **kwargs)
+    return wrapper
+
+
+@lru_cache(maxsize=256)
+def get_cache_path(url: str, suffix: str = ".pkl", source: str = "url") -> Path:
+    """Get cache file path for a URL, prefixed with its source name."""
     url_hash = hashlib.md5(url.encode()).hexdigest()[:12]
-    return CACHE_DIR / f"{url_hash}{suffix}"
+    return CACHE_DIR / f"{source}_{url_hash}{suffix}"
+
+
+def cache_ttl_days(cache_path: Path) -> int:
+    """Cache lifetime for a file, looked up from its source name prefix."""
+    if CACHE_DAYS_OVERRIDE is not None:
+        return CACHE_DAYS_OVERRIDE
+    source = cache_path.name.split('_', 1)[0].split('.', 1)[0]
+    return CACHE_TTL_DAYS.get(source, CACHE_MAX_AGE_DAYS)
 
 
-def is_cache_valid(cache_path: Path, max_age_days: int = CACHE_MAX_AGE_DAYS) -> bool:
-    """Check if cache file exists and is not too old."""
-    if not cache_path.exists():
+def is_cache_valid(cache_path: Path, max_age_days: Optional[int] = None) -> bool:
+    """
+    Check if cache file exists and is younger than its source's TTL.
+
+    A valid file counts as a cache hit: its access time is bumped (leaving
+    the mtime that the TTL is measured from) so LRU eviction keeps it.
+    """
+    try:
+        st = cache_path.stat()
+    except FileNotFoundError:
+        return False
+    if max_age_days is None:
+        max_age_days = cache_ttl_days(cache_path)
+    now = datetime.now().timestamp()
+    if now - st.st_mtime >= max_age_days * 86400:
         return False
-    age = datetime.now().timestamp() - cache_path.stat().st_mtime
-    return age < max_age_days * 86400
+    os.utime(cache_path, (now, st.st_mtime))
+    return True
+
+
+def clear_cache(pattern: str = "*") -> int:
+    """
+    Delete cached files whose names match a glob (e.g. "yahoo_*").
+
+    "*" removes the whole cache directory. Returns the number of files
+    deleted.
+    """
+    if pattern == "*":
+        count = sum(1 for p in CACHE_DIR.rglob("*") if p.is_file())
+        shutil.rmtree(CACHE_DIR, ignore_errors=True)
+        make_cache_dirs()
+        return count
+
+    count = 0
+    for path in CACHE_DIR.rglob(pattern):
+        if path.is_file():
+            path.unlink(missing_ok=True)
+            count += 1
+    return count
+
+
+def evict_cache(max_bytes: int) -> None:
+    """Delete least recently used cache files until the cache fits max_bytes."""
+    entries = sorted(
+        ((p.stat(), p) for p in CACHE_DIR.rglob("*") if p.is_file()),
+        key=lambda entry: entry[0].st_atime,
+    )
+    total = sum(st.st_size for st, _ in entries)
+    for st, path in entries:
+        if total <= max_bytes:
+            break
+        path.unlink(missing_ok=True)
+        total -= st.st_size
 
 
-def save_to_cache(data: bytes, url: str, suffix: str = ".bin") -> None:
-    """Save raw data to cache."""
-    CACHE_DIR.mkdir(exist_ok=True)
-    cache_path = get_cache_path(url, suffix)
-    cache_path.write_bytes(data)
+def save_stream_to_cache(url: str, suffix: str = ".bin", source: str = "url") -> Path:
+    """
+    Download a URL straight into its cache file.
+
+    The body is streamed into a temporary file next to the cache entry and
+    renamed into place, so the download is never held in memory whole and
+    a failed transfer never leaves a truncated cache file behind.
+    """
+    cache_path = get_cache_path(url, suffix, source)
+    tmp = tempfile.NamedTemporaryFile(dir=CACHE_DIR, suffix=suffix + ".part", delete=False)
+    try:
+        with tmp:
+            http_download(url, tmp)
+        os.replace(tmp.name, cache_path)
+    except BaseException:
+        Path(tmp.name).unlink(missing_ok=True)
+        raise
     print(f"    [Cached to {cache_path.name}]")
+    return cache_path
 
 
-def load_from_cache(url: str, suffix: str = ".bin") -> Optional[bytes]:
-    """Load raw data from cache if valid."""
-    cache_path = get_cache_path(url, suffix)
-    if is_cache_valid(cache_path):
-        print(f"    [Using cached {cache_path.name}]")
-        return cache_path.read_bytes()
-    return None
+def series_cache_path(cache_key: str) -> Path:
+    """Cache file for a Series: Feather when pyarrow is available, else pickle."""
+    return CACHE_DIR / f"{cache_key}{'.feather' if HAS_PYARROW else '.pkl'}"
 
 
-def fetch_url_cached(url: str, suffix: str = ".bin") -> bytes:
-    """Fetch URL with caching."""
-    cached = load_from_cache(url, suffix)
-    if cached is not None:
-        return cached
+def save_series_cache(series: pd.Series, cache_key: str) -> None:
+    """Save a year-indexed Series to the cache."""
+    cache_path = series_cache_path(cache_key)
+    with _CACHE_LOCK:
+        if HAS_PYARROW:
+            series.rename_axis('Year').rename('v').reset_index().to_feather(cache_path)
+        else:
+            with open(cache_path, 'wb') as f:
+                # Protocol 5 writes the NumPy buffers as raw frames
+                pickle.dump(series, f, protocol=pickle.HIGHEST_PROTOCOL)
+    print(f"    [Cached to {cache_path.name}]")
+
+
+def load_series_cache(cache_key: str) -> Optional[pd.Series]:
+    """Load a cached year-indexed Series if present and not expired."""
+    cache_path = series_cache_path(cache_key)
+    if not is_cache_valid(cache_path):
+        return None
+
+    print(f"    [Using cached {cache_path.name}]")
+    if HAS_PYARROW:
+        return pd.read_feather(cache_path).set_index('Year')['v']
+    with open(cache_path, 'rb') as f:
+        return pickle.load(f)
+
+
+def disk_cached(key):
+    """
+    Cache a function returning a year-indexed Series via the series cache.
+
+    `key` maps the call arguments to a file-name-safe cache key.
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            cache_key = key(*args, **kwargs)
+            series = load_series_cache(cache_key)
+            if series is None:
+                series = fn(*args, **kwargs)
+                save_series_cache(series, cache_key)
+            return series
+        return wrapper
+    return decorator
+
+
+# Transient failures worth retrying: rate limiting and server errors
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+MAX_ATTEMPTS = 5
+
+
+def backoff_delay(attempt: int, retry_after: Optional[str] = None,
+                  base: float = 0.5, cap: float = 30.0) -> float:
+    """
+    Seconds to wait before retrying after failed attempt `attempt` (0-based).
+
+    Uses the server's Retry-After (in seconds) when given, otherwise
+    exponential backoff with jitter, capped at `cap`.
+    """
+    if retry_after:
+        try:
+            return min(cap, float(retry_after))
+        except ValueError:
+            pass  # HTTP-date form; fall back to backoff
+    return min(cap, base * 2 ** attempt + random.uniform(0, base))
+
+
+def http_download(url: str, dest, timeout: int = 60) -> None:
+    """
+    Stream a URL into the open binary file dest.
+
+    Reuses the pooled session when requests is installed (its adapter
+    retries transient errors); the urllib fallback retries 429/5xx itself.
+    """
+    session = _session()
+    if session is not None:
+        with session.get(url, timeout=timeout, stream=True) as response:
+            response.raise_for_status()
+            for chunk in response.iter_content(chunk_size=1 << 16):
+                dest.write(chunk)
+        return
 
-    print(f"    [Downloading from {url[:50]}...]")
     req = Request(url, headers={'User-Agent': 'Mozilla/5.0'})
-    with urlopen(req, timeout=60) as response:
-        data = response.read()
+    for attempt in range(MAX_ATTEMPTS):
+        try:
+            with urlopen(req, timeout=timeout) as response:
+                shutil.copyfileobj(response, dest)
+            return
+        except HTTPError as e:
+            if e.code not in RETRY_STATUSES or attempt == MAX_ATTEMPTS - 1:
+                raise
+            delay = backoff_delay(attempt, e.headers.get('Retry-After'))
+            print(f"    [HTTP {e.code} from {url[:50]}, retrying in {delay:.1f}s]")
+        dest.seek(0)
+        dest.truncate()
+        time.sleep(delay)
+
+
+def fetch_url_cached_path(url: str, suffix: str = ".bin", source: str = "url") -> Path:
+    """
+    Fetch URL with caching and return the path of the cached file.
+
+    Parsers can open the path directly instead of copying the whole file
+    into memory first.
+    """
+    cache_path = get_cache_path(url, suffix, source)
+    # One download per URL even when several threads want it at once
+    with _URL_LOCKS.setdefault(url, threading.Lock()):
+        if is_cache_valid(cache_path):
+            print(f"    [Using cached {cache_path.name}]")
+            return cache_path
+
+        print(f"    [Downloading from {url[:50]}...]")
+        return save_stream_to_cache(url, suffix, source)
+
+
+def write_json_atomic(path: Path, obj) -> None:
+    """
+    Write obj as JSON to a temporary file and rename it into place, so an
+    interrupted run never leaves a half-written cache file behind.
+    """
+    tmp = tempfile.NamedTemporaryFile("w", dir=path.parent, suffix=".json.part", delete=False)
+    try:
+        with tmp:
+            json.dump(obj, tmp)
+        with _CACHE_LOCK:
+            os.replace(tmp.name, path)
+    except BaseException:
+        Path(tmp.name).unlink(missing_ok=True)
+        raise
+
+
+def disk_memoize(key):
+    """
+    Memoize a function returning AssetStats as JSON under STATS_CACHE_DIR.
+
+    `key` maps the call arguments to a file-name-safe cache key. A cache
+    file that can't be loaded (corrupt, or from an older AssetStats) is
+    treated as a miss and overwritten.
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            cache_path = STATS_CACHE_DIR / f"{key(*args, **kwargs)}.json"
+            if is_cache_valid(cache_path):
+                try:
+                    return AssetStats(**json.loads(cache_path.read_text()))
+                except (ValueError, TypeError, KeyError):
+                    pass
+
+            stats = fn(*args, **kwargs)
+            write_json_atomic(cache_path, asdict(stats))
+            return stats
+        return wrapper
+    return decorator
+
+
+def results_snapshot_path(start_year: int) -> Path:
+    """
+    Snapshot of a whole run's results.
+
+    Keyed on what changes the set of sources: the start year, whether
+    yfinance is installed and whether a FRED API key is available.
+    """
+    flags = f"{int(HAS_YFINANCE)}{int(bool(os.environ.get('FRED_API_KEY')))}"
+    return CACHE_DIR / f"results_{start_year}_{flags}.json"
+
+
+def save_results_snapshot(path: Path, results: list[tuple[str, str, "AssetStats"]],
+                          inflation: "AssetStats") -> None:
+    """Save (prefix, name, stats) results and inflation stats of a complete run."""
+    payload = {
+        "results": [[prefix, name, asdict(stats)] for prefix, name, stats in results],
+        "inflation": asdict(inflation),
+    }
+    write_json_atomic(path, payload)
+
+
+def load_results_snapshot(path: Path):
+    """
+    Load a fresh results snapshot as (results, inflation), or None.
+
+    An unreadable snapshot (corrupt, or written by an older version of
+    this script) is treated as a cache miss.
+    """
+    if not is_cache_valid(path):
+        return None
+    try:
+        payload = json.loads(path.read_text())
+        results = [(prefix, name, AssetStats(**stats)) for prefix, name, stats in payload["results"]]
+        return results, AssetStats(**payload["inflation"])
+    except (ValueError, TypeError, KeyError):
+        return None
 
-    save_to_cache(data, url, suffix)
-    return data
 
 # Optional imports with graceful degradation
-try:
-    import yfinance as yf
-    HAS_YFINANCE = True
-except ImportError:
-    HAS_YFINANCE = False
+#
+# Only check that optional packages are installed here; they are imported
+# where they are used, so runs that never touch e.g. Yahoo or FRED don't
+# pay for importing them.
+def _has_module(name: str) -> bool:
+    """Whether an optional dependency is installed, without importing it."""
+    return importlib.util.find_spec(name) is not None
+
+
+HAS_YFINANCE = _has_module("yfinance")
+if not HAS_YFINANCE:
     print("Warning: yfinance not installed. Run: pip install yfinance")
 
-try:
-    from fredapi import Fred
-    HAS_FRED = True
-except ImportError:
-    HAS_FRED = False
+HAS_FRED = _has_module("fredapi")
+if not HAS_FRED:
     print("Warning: fredapi not installed. Run: pip install fredapi")
 
-try:
-    import openpyxl
-    HAS_OPENPYXL = True
-except ImportError:
-    HAS_OPENPYXL = False
+HAS_OPENPYXL = _has_module("openpyxl")
+if not HAS_OPENPYXL:
     print("Warning: openpyxl not installed. Run: pip install openpyxl (needed for Shiller data)")
 
+HAS_REQUESTS = _has_module("requests")
+HAS_CALAMINE = _has_module("python_calamine")  # Rust-based engine for pd.read_excel
+HAS_XLRD = _has_module("xlrd")  # pd.read_excel's engine for legacy .xls
+HAS_PYARROW = _has_module("pyarrow")  # Only used for faster on-disk caches
+HAS_NUMBA = _has_module("numba")
+HAS_ORJSON = _has_module("orjson")  # Faster JSON output
+
+
+@lru_cache(maxsize=1)
+def _yfinance():
+    """
+    Import yfinance on first use.
+
+    Only called right before a Yahoo download, so runs served from the
+    cache (or that never reach a Yahoo fallback) don't import it at all.
+    """
+    try:
+        import yfinance
+    except ImportError:
+        raise ImportError("yfinance is required. Run: pip install yfinance") from None
+    return yfinance
+
+
+@lru_cache(maxsize=1)
+def _session():
+    """
+    One pooled requests session, or None when requests isn't installed.
+
+    Downloads from the same host reuse the TCP/TLS connection (keep-alive)
+    instead of handshaking for every file.
+    """
+    if not HAS_REQUESTS:
+        return None
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.headers["User-Agent"] = "Mozilla/5.0"
+
+    # Pool enough connections for the concurrent fetchers and retry
+    # transient failures with backoff instead of losing the source
+    adapter = HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
 
 # ============================================================================
 # Data Classes
 # ============================================================================
 
-@dataclass
+@dataclass(frozen=True)
 class AssetStats:
-    """Statistics for an asset class."""
+    """Statistics for an asset class (immutable and hashable)."""
     name: str
     description: str
     source: str
     start_year: int
     end_year: int
     num_years: int
-    annual_returns: list[float]
+    annual_returns: tuple[float, ...]
     arithmetic_mean: float
     geometric_mean: float
     std_dev: float
@@ -183,8 +553,12 @@ class AssetStats:
     skewness: float
     kurtosis: float  # Excess kurtosis (normal = 0)
 
-    def to_dict(self) -> dict:
-        return {
+    def __post_init__(self):
+        # Keep the returns hashable when built from a list (e.g. cached JSON)
+        object.__setattr__(self, "annual_returns", tuple(self.annual_returns))
+
+    def to_dict(self, include_returns: bool = False) -> dict:
+        d = {
             "name": self.name,
             "description": self.description,
             "source": self.source,
@@ -199,42 +573,177 @@ class AssetStats:
             "skewness": self.skewness,
             "kurtosis": self.kurtosis,
         }
+        if include_returns:
+            d["annual_returns"] = self.annual_returns
+        return d
+
+
+def _moments(arr: np.ndarray) -> tuple[float, float, float, float, float, float]:
+    """
+    Single-pass (Welford/Terriberry) moments of an array.
+
+    Returns (mean, sample variance, skewness, excess kurtosis, min, max) with
+    the same bias corrections pandas applies in Series.skew()/kurtosis().
+    """
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    m3 = 0.0
+    m4 = 0.0
+    lo = np.inf
+    hi = -np.inf
+    for x in arr:
+        n1 = n
+        n += 1
+        delta = x - mean
+        delta_n = delta / n
+        delta_n2 = delta_n * delta_n
+        term1 = delta * delta_n * n1
+        mean += delta_n
+        m4 += term1 * delta_n2 * (n * n - 3 * n + 3) + 6 * delta_n2 * m2 - 4 * delta_n * m3
+        m3 += term1 * delta_n * (n - 2) - 3 * delta_n * m2
+        m2 += term1
+        lo = min(lo, x)
+        hi = max(hi, x)
+
+    var = m2 / (n - 1) if n > 1 else np.nan
+    if n < 3:
+        skew = np.nan
+    elif m2 == 0:
+        skew = 0.0
+    else:
+        skew = np.sqrt(n - 1) * n / (n - 2) * m3 / m2 ** 1.5
+    if n < 4:
+        kurt = np.nan
+    elif m2 == 0:
+        kurt = 0.0
+    else:
+        kurt = (n * (n + 1) * (n - 1) * m4 / ((n - 2) * (n - 3) * m2 * m2)
+                - 3 * (n - 1) ** 2 / ((n - 2) * (n - 3)))
+    return mean, var, skew, kurt, lo, hi
+
+
+def _moments_numpy(arr: np.ndarray) -> tuple[float, float, float, float, float, float]:
+    """Vectorized equivalent of _moments() for when numba isn't available."""
+    n = len(arr)
+    mean = arr.mean()
+    d = arr - mean
+    d2 = d * d
+    m2 = d2.sum()
+    m3 = (d2 * d).sum()
+    m4 = (d2 * d2).sum()
+
+    var = m2 / (n - 1) if n > 1 else np.nan
+    if n < 3:
+        skew = np.nan
+    elif m2 == 0:
+        skew = 0.0
+    else:
+        skew = np.sqrt(n - 1) * n / (n - 2) * m3 / m2 ** 1.5
+    if n < 4:
+        kurt = np.nan
+    elif m2 == 0:
+        kurt = 0.0
+    else:
+        kurt = (n * (n + 1) * (n - 1) * m4 / ((n - 2) * (n - 3) * m2 * m2)
+                - 3 * (n - 1) ** 2 / ((n - 2) * (n - 3)))
+    return mean, var, skew, kurt, arr.min(), arr.max()
+
+
+@lru_cache(maxsize=1)
+def _moments_impl():
+    """
+    The numba-compiled _moments() when numba is installed, else the NumPy
+    version. Resolved on first use so numba is only imported (and the
+    kernel only loaded) when stats actually need computing.
+    """
+    if HAS_NUMBA:
+        from numba import njit
+        return njit(cache=True)(_moments)
+    return _moments_numpy
+
+
+def _stats_key(name: str, description: str, source: str, returns: np.ndarray,
+               start_year: int, end_year: int) -> str:
+    """Cache key covering the labels and the exact returns data."""
+    digest = hashlib.md5(f"{name}|{description}|{source}|{start_year}|{end_year}".encode())
+    digest.update(np.ascontiguousarray(returns, dtype=np.float64).tobytes())
+    return digest.hexdigest()
 
 
 def compute_stats(name: str, description: str, source: str, returns: pd.Series) -> AssetStats:
-    """Compute statistics from a series of annual returns."""
+    """Compute statistics from a year-indexed Series of annual returns."""
     returns = returns.dropna()
-    arr = returns.values.astype(float)
+    if len(returns) == 0:
+        raise ValueError(f"No valid returns data for {name}")
+
+    return compute_array_stats(
+        name,
+        description,
+        source,
+        returns.to_numpy(dtype=np.float64),
+        int(returns.index.min()),
+        int(returns.index.max()),
+    )
+
+
+@disk_memoize(key=_stats_key)
+def compute_array_stats(name: str, description: str, source: str, returns: np.ndarray,
+                        start_year: int, end_year: int) -> AssetStats:
+    """
+    Compute statistics from an array of annual returns (no NaNs).
+
+    Fetchers that already hold plain arrays call this directly rather than
+    building a Series just for compute_stats().
+    """
+    # Stay in float64: results are published to 6 decimals and the arrays are
+    # ~150 elements, so float32 would cost accuracy for no measurable gain.
+    # asarray() avoids a copy when the input is already float64.
+    arr = np.asarray(returns, dtype=np.float64)
 
     if len(arr) == 0:
         raise ValueError(f"No valid returns data for {name}")
 
-    # Geometric mean: (prod(1 + r))^(1/n) - 1
-    # Handle potential negative total returns
-    cumulative = np.prod(1 + arr)
-    if cumulative > 0:
-        geo_mean = cumulative ** (1 / len(arr)) - 1
+    # Geometric mean: (prod(1 + r))^(1/n) - 1, computed in log space as
+    # expm1(mean(log1p(r))) so long histories can't overflow the product
+    if np.all(arr > -1):
+        geo_mean = np.expm1(np.log1p(arr).mean())
     else:
         geo_mean = -1.0  # Total loss
 
+    mean, var, skewness, kurtosis, min_return, max_return = _moments_impl()(arr)
+
     return AssetStats(
         name=name,
         description=description,
         source=source,
-        start_year=int(returns.index.min()),
-        end_year=int(returns.index.max()),
+        start_year=start_year,
+        end_year=end_year,
         num_years=len(arr),
-        annual_returns=arr.tolist(),
-        arithmetic_mean=float(np.mean(arr)),
+        annual_returns=tuple(arr.tolist()),
+        arithmetic_mean=float(mean),
         geometric_mean=float(geo_mean),
-        std_dev=float(np.std(arr, ddof=1)),  # Sample std dev
-        min_return=float(np.min(arr)),
-        max_return=float(np.max(arr)),
-        skewness=float(pd.Series(arr).skew()),
-        kurtosis=float(pd.Series(arr).kurtosis()),  # Excess kurtosis
+        std_dev=float(np.sqrt(var)),  # Sample std dev
+        min_return=float(min_return),
+        max_return=float(max_return),
+        skewness=float(skewness),
+        kurtosis=float(kurtosis),
     )
 
 
+def duration_total_returns(yields_pct: pd.Series, duration: float = 8.0) -> pd.Series:
+    """
+    Approximate annual bond total returns from yearly yields (in percent).
+
+    Total return = starting yield - duration * yield change (price falls
+    when yields rise). Years with a missing yield on either side are dropped.
+    """
+    y = yields_pct.to_numpy(dtype=np.float64) / 100  # Convert percent to decimal
+    total = y[:-1] - duration * (y[1:] - y[:-1])
+    keep = ~np.isnan(total)
+    return pd.Series(total[keep], index=yields_pct.index[1:][keep])
+
+
 # ============================================================================
 # Shiller Data (Yale) - S&P 500 back to 1871
 # http://www.econ.yale.edu/~shiller/data.htm
@@ -243,24 +752,37 @@ def compute_stats(name: str, description: str, source: str, returns: pd.Series)
 SHILLER_DATA_URL = "http://www.econ.yale.edu/~shiller/data/ie_data.xls"
 
 
+@synchronized
+@lru_cache(maxsize=1)
 def fetch_shiller_data() -> pd.DataFrame:
     """
     Fetch Robert Shiller's historical S&P 500 data.
 
-    Returns DataFrame with columns: Date, Price, Dividend, Earnings, CPI,
-    Long_Rate, Real_Price, Real_Dividend, Real_TR_Price, CAPE
+    Returns DataFrame indexed (and sorted) by Year with columns: Date, Price,
+    Dividend, Earnings, CPI, Long_Rate, Real_Price, Real_Dividend,
+    Real_TR_Price, CAPE, Month
+
+    The parsed frame is memoized for the life of the process, so callers
+    must treat it as read-only. When pyarrow is available it is also saved
+    as Parquet so later runs can skip the XLS parse entirely.
     """
+    # Named with the source prefix so --clear-cache 'shiller_*' removes it too
+    parquet_path = CACHE_DIR / "shiller_data.parquet"
+    if HAS_PYARROW and is_cache_valid(parquet_path):
+        print(f"    [Using cached {parquet_path.name}]")
+        return pd.read_parquet(parquet_path)
+
     if not HAS_OPENPYXL:
         raise ImportError("openpyxl required for Shiller data")
 
     print("  Fetching Shiller data from Yale...")
 
     # Download the Excel file (with caching)
-    data = fetch_url_cached(SHILLER_DATA_URL, ".xls")
+    xls_path = fetch_url_cached_path(SHILLER_DATA_URL, ".xls", "shiller")
 
     # Read the Data sheet, skipping header rows
     df = pd.read_excel(
-        io.BytesIO(data),
+        xls_path,
         sheet_name="Data",
         skiprows=7,  # Skip header explanation rows
         usecols="A:M",
@@ -278,12 +800,73 @@ def fetch_shiller_data() -> pd.DataFrame:
     df['Date'] = pd.to_numeric(df['Date'], errors='coerce')
     df = df[df['Date'].notna()]
 
+    # Every column is numeric; coerce stray text (e.g. "NA" CAPE values)
+    # so the frame has clean dtypes for Parquet
+    df = df.apply(pd.to_numeric, errors='coerce')
+
     df['Year'] = df['Date'].astype(int)
     df['Month'] = ((df['Date'] % 1) * 100).round().astype(int)
+    df = df.set_index('Year').sort_index()
+
+    if HAS_PYARROW:
+        df.to_parquet(parquet_path)
+        print(f"    [Cached to {parquet_path.name}]")
 
     return df
 
 
+@synchronized
+@lru_cache(maxsize=1)
+def _shiller_yearly() -> pd.DataFrame:
+    """
+    Per-year aggregates of the Shiller data, shared by the Shiller fetchers.
+
+    Columns: Price_mean, Div_mean, CPI_last, Rate_mean and Price_jan
+    (January index level, NaN for years without a January row).
+
+    The monthly rows are sorted by year, so each aggregate is a single
+    ufunc.reduceat over contiguous year segments. Results match
+    df.groupby(level='Year').agg(...) including its NaN skipping.
+    """
+    df = fetch_shiller_data()
+    years = df.index.to_numpy()
+    n = len(years)
+    starts = np.flatnonzero(np.r_[True, years[1:] != years[:-1]])
+    ends = np.r_[starts[1:], n]
+    positions = np.arange(n)
+
+    def yearly_mean(column: str) -> np.ndarray:
+        values = df[column].to_numpy(dtype=np.float64)
+        valid = ~np.isnan(values)
+        sums = np.add.reduceat(np.where(valid, values, 0.0), starts)
+        counts = np.add.reduceat(valid.astype(np.int64), starts)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return sums / counts
+
+    def yearly_pick(column: str, mask: np.ndarray, last: bool) -> np.ndarray:
+        values = df[column].to_numpy(dtype=np.float64)
+        mask = mask & ~np.isnan(values)
+        if last:
+            pos = np.maximum.reduceat(np.where(mask, positions, -1), starts)
+            found = pos >= starts
+        else:
+            pos = np.minimum.reduceat(np.where(mask, positions, n), starts)
+            found = pos < ends
+        return np.where(found, values[np.where(found, pos, 0)], np.nan)
+
+    everything = np.ones(n, dtype=bool)
+    return pd.DataFrame(
+        {
+            'Price_mean': yearly_mean('Price'),
+            'Div_mean': yearly_mean('Dividend'),
+            'CPI_last': yearly_pick('CPI', everything, last=True),
+            'Rate_mean': yearly_mean('Long_Rate'),
+            'Price_jan': yearly_pick('Price', df['Month'].to_numpy() == 1, last=False),
+        },
+        index=pd.Index(years[starts], name='Year'),
+    )
+
+
 def fetch_shiller_sp500_returns(start_year: int = 1871) -> AssetStats:
     """
     Fetch S&P 500 total returns from Shiller data.
@@ -296,25 +879,16 @@ def fetch_shiller_sp500_returns(start_year: int = 1871) -> AssetStats:
     Total Return = (P1 / P0) * (1 + D/P) - 1
     where D/P is the average dividend yield over the year.
     """
-    df = fetch_shiller_data()
-
-    # Filter to start year
-    df = df[df['Year'] >= start_year]
-
-    # Get January values for each year to compute year-over-year returns
-    # Use first month of year for cleaner annual returns
-    jan_data = df[df['Month'] == 1].copy()
-    jan_data = jan_data.set_index('Year')
+    yearly = _shiller_yearly().loc[start_year:]
 
     # Price return (January to January)
-    price_returns = jan_data['Price'].pct_change()
+    # Use first month of year for cleaner annual returns
+    price_returns = yearly['Price_jan'].dropna().pct_change()
 
     # Dividend yield: Shiller's Dividend column is annualized dividend rate
     # Dividend yield = D / P (already annualized)
     # We use the average dividend yield over the year
-    yearly_avg_div = df.groupby('Year')['Dividend'].mean()
-    yearly_avg_price = df.groupby('Year')['Price'].mean()
-    dividend_yield = yearly_avg_div / yearly_avg_price
+    dividend_yield = yearly['Div_mean'] / yearly['Price_mean']
 
     # Total return = price return + dividend yield
     # Align indices
@@ -335,11 +909,8 @@ def fetch_shiller_sp500_returns(start_year: int = 1871) -> AssetStats:
 
 def fetch_shiller_inflation(start_year: int = 1871) -> AssetStats:
     """Fetch CPI inflation from Shiller data."""
-    df = fetch_shiller_data()
-    df = df[df['Year'] >= start_year]
-
-    # Get December CPI for each year
-    yearly_cpi = df.groupby('Year')['CPI'].last()
+    # December CPI for each year
+    yearly_cpi = _shiller_yearly().loc[start_year:, 'CPI_last']
 
     # Compute annual inflation
     inflation = yearly_cpi.pct_change().dropna()
@@ -361,25 +932,12 @@ def fetch_shiller_bond_returns(start_year: int = 1871) -> AssetStats:
     Estimate long-term bond returns from Shiller's long-term interest rate data.
     Uses a simple duration-based approximation for price changes.
     """
-    df = fetch_shiller_data()
-    df = df[df['Year'] >= start_year]
-
-    # Get yearly interest rates (GS10 equivalent - 10-year Treasury)
-    yearly = df.groupby('Year')['Long_Rate'].mean()
+    # Yearly interest rates (GS10 equivalent - 10-year Treasury)
+    yearly = _shiller_yearly().loc[start_year:, 'Rate_mean']
 
-    # Approximate bond total return:
-    # Return ≈ Yield + Duration * (Change in Yield)
-    # Assume duration ≈ 8 years for long-term bonds
-    duration = 8.0
-
-    # Yield as decimal
-    yields = yearly / 100
-    yield_changes = yields.diff()
-
-    # Total return = starting yield - duration * yield change
-    # (Price falls when yields rise)
-    total_returns = yields.shift(1) - duration * yield_changes
-    total_returns = total_returns.dropna()
+    # Approximate bond total return, assuming duration ≈ 8 years
+    # for long-term bonds
+    total_returns = duration_total_returns(yearly, duration=8.0)
 
     # Filter to complete years
     current_year = datetime.now().year
@@ -400,6 +958,13 @@ def fetch_shiller_bond_returns(start_year: int = 1871) -> AssetStats:
 
 FRENCH_BASE_URL = "https://mba.tuck.dartmouth.edu/pages/faculty/ken.french/ftp/"
 
+# Header line followed by the first run of rows keyed by a 4-digit year
+# (monthly rows use YYYYMM keys, so they never match)
+FRENCH_ANNUAL_BLOCK = re.compile(
+    r"^([^\r\n]*)\r?\n((?:[ \t]*\d{4}[ \t]*,[^\r\n]*(?:\r?\n|\Z))+)",
+    re.MULTILINE,
+)
+
 
 def fetch_french_csv(filename: str) -> str:
     """Download and parse a Kenneth French data file."""
@@ -407,10 +972,10 @@ def fetch_french_csv(filename: str) -> str:
     print(f"  Fetching {filename} from Kenneth French Data Library...")
 
     # Download with caching
-    data = fetch_url_cached(url, ".zip")
+    zip_path = fetch_url_cached_path(url, ".zip", "french")
 
     # French data comes as ZIP files containing CSV
-    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+    with zipfile.ZipFile(zip_path) as zf:
         # Get the CSV file (usually only one file in the zip)
         csv_name = [n for n in zf.namelist() if n.endswith('.CSV') or n.endswith('.csv')][0]
         with zf.open(csv_name) as f:
@@ -419,49 +984,71 @@ def fetch_french_csv(filename: str) -> str:
     return content
 
 
+def parse_french_annual_frame(content: str) -> pd.DataFrame:
+    """
+    Parse the annual section of Kenneth French data into a DataFrame.
+
+    French files have annual data after the monthly section, preceded by a
+    column header line. Format: YYYY, value1, value2, ...
+    Returns one column per factor, indexed by year, as decimals.
+    """
+    match = FRENCH_ANNUAL_BLOCK.search(content)
+    if match is None:
+        raise ValueError("No annual data found in French data file")
+
+    header, block = match.groups()
+    if HAS_PYARROW:
+        # Arrow's multithreaded parser; it trims the padding around numbers
+        # itself (it doesn't support skipinitialspace)
+        df = pd.read_csv(
+            io.BytesIO(f"{header}\n{block}".encode()),
+            index_col=0,
+            engine="pyarrow",
+        )
+    else:
+        df = pd.read_csv(
+            io.StringIO(f"{header}\n{block}"),
+            index_col=0,
+            skipinitialspace=True,
+        )
+    df.columns = df.columns.str.strip()
+    df.index = df.index.astype(int)
+    df.index.name = 'Year'
+    return df / 100  # Convert percentage to decimal
+
+
 def parse_french_annual_data(content: str, value_column: int = 1) -> pd.Series:
     """
     Parse Kenneth French data format.
 
-    French files have annual data after a blank line following monthly data.
-    Format: YYYY, value1, value2, ...
+    Returns the annual series for the given (1-based, after the year)
+    value column.
     """
-    lines = content.strip().split('\n')
+    return parse_french_annual_frame(content).iloc[:, value_column - 1]
 
-    # Find annual data section (after monthly, before any other sections)
-    in_annual = False
-    annual_data = []
 
-    for line in lines:
-        line = line.strip()
+@synchronized_per_arg
+@lru_cache(maxsize=4)
+def _parse_french_annual(filename: str) -> pd.DataFrame:
+    """
+    Parse the annual section of a Kenneth French data file.
 
-        # Skip empty lines and headers
-        if not line or line.startswith('Average'):
-            if in_annual:
-                break  # End of annual section
-            continue
+    Returns a DataFrame indexed by year with one column per factor
+    (e.g. Mkt-RF, SMB, HML, RF), converted from percent to decimal.
+    Memoized so fetchers sharing a file only download and parse it once.
+    """
+    feather_path = CACHE_DIR / f"french_{Path(filename).stem}.feather"
+    if HAS_PYARROW and is_cache_valid(feather_path):
+        print(f"    [Using cached {feather_path.name}]")
+        return pd.read_feather(feather_path).set_index('Year')
 
-        # Check if this looks like annual data (4-digit year)
-        parts = [p.strip() for p in line.split(',')]
-        if len(parts) >= 2:
-            try:
-                year = int(parts[0])
-                if 1900 <= year <= 2100:  # Looks like a year
-                    if len(parts[0]) == 4:  # Annual data has 4-digit years
-                        in_annual = True
-                        value = float(parts[value_column])
-                        annual_data.append((year, value / 100))  # Convert percentage to decimal
-            except (ValueError, IndexError):
-                continue
-
-    if not annual_data:
-        raise ValueError("No annual data found in French data file")
+    df = parse_french_annual_frame(fetch_french_csv(filename))
 
-    series = pd.Series(
-        [v for _, v in annual_data],
-        index=[y for y, _ in annual_data]
-    )
-    return series
+    if HAS_PYARROW:
+        df.reset_index().to_feather(feather_path)
+        print(f"    [Cached to {feather_path.name}]")
+
+    return df
 
 
 def fetch_french_market_returns(start_year: int = 1926) -> AssetStats:
@@ -469,41 +1056,11 @@ def fetch_french_market_returns(start_year: int = 1926) -> AssetStats:
     Fetch US market returns from Fama-French factors.
     Uses Mkt-RF + RF to get total market return.
     """
-    content = fetch_french_csv("F-F_Research_Data_Factors_CSV.zip")
-
-    # Parse the data - need both Mkt-RF (col 1) and RF (col 4)
-    lines = content.strip().split('\n')
-
-    annual_data = []
-    in_annual = False
-
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
+    df = _parse_french_annual("F-F_Research_Data_Factors_CSV.zip")
 
-        parts = [p.strip() for p in line.split(',')]
-        if len(parts) >= 5:
-            try:
-                year = int(parts[0])
-                if 1900 <= year <= 2100 and len(parts[0]) == 4:
-                    in_annual = True
-                    mkt_rf = float(parts[1]) / 100  # Market excess return
-                    rf = float(parts[4]) / 100      # Risk-free rate
-                    total_return = mkt_rf + rf
-                    annual_data.append((year, total_return))
-            except (ValueError, IndexError):
-                continue
-
-    series = pd.Series(
-        [v for _, v in annual_data],
-        index=[y for y, _ in annual_data]
-    )
-    series = series[series.index >= start_year]
-
-    # Remove current incomplete year
+    # Market excess return + risk-free rate, excluding the incomplete current year
     current_year = datetime.now().year
-    series = series[series.index < current_year]
+    series = (df['Mkt-RF'] + df['RF']).loc[start_year:current_year - 1]
 
     return compute_stats(
         "US Market",
@@ -518,34 +1075,10 @@ def fetch_french_smb_returns(start_year: int = 1926) -> AssetStats:
     Fetch Small Minus Big (SMB) factor returns.
     This represents the return premium of small stocks over large stocks.
     """
-    content = fetch_french_csv("F-F_Research_Data_Factors_CSV.zip")
-
-    lines = content.strip().split('\n')
-    annual_data = []
-
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-
-        parts = [p.strip() for p in line.split(',')]
-        if len(parts) >= 3:
-            try:
-                year = int(parts[0])
-                if 1900 <= year <= 2100 and len(parts[0]) == 4:
-                    smb = float(parts[2]) / 100  # SMB factor
-                    annual_data.append((year, smb))
-            except (ValueError, IndexError):
-                continue
-
-    series = pd.Series(
-        [v for _, v in annual_data],
-        index=[y for y, _ in annual_data]
-    )
-    series = series[series.index >= start_year]
+    df = _parse_french_annual("F-F_Research_Data_Factors_CSV.zip")
 
     current_year = datetime.now().year
-    series = series[series.index < current_year]
+    series = df['SMB'].loc[start_year:current_year - 1]
 
     return compute_stats(
         "Small Cap Premium",
@@ -560,38 +1093,11 @@ def fetch_french_small_cap_returns(start_year: int = 1926) -> AssetStats:
     Fetch small cap returns by adding SMB to market return.
     Small Cap Return ≈ Market Return + SMB
     """
-    content = fetch_french_csv("F-F_Research_Data_Factors_CSV.zip")
-
-    lines = content.strip().split('\n')
-    annual_data = []
-
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-
-        parts = [p.strip() for p in line.split(',')]
-        if len(parts) >= 5:
-            try:
-                year = int(parts[0])
-                if 1900 <= year <= 2100 and len(parts[0]) == 4:
-                    mkt_rf = float(parts[1]) / 100
-                    smb = float(parts[2]) / 100
-                    rf = float(parts[4]) / 100
-                    # Small cap ≈ Market + SMB
-                    small_cap = mkt_rf + rf + smb
-                    annual_data.append((year, small_cap))
-            except (ValueError, IndexError):
-                continue
-
-    series = pd.Series(
-        [v for _, v in annual_data],
-        index=[y for y, _ in annual_data]
-    )
-    series = series[series.index >= start_year]
+    df = _parse_french_annual("F-F_Research_Data_Factors_CSV.zip")
 
+    # Small cap ≈ Market + SMB
     current_year = datetime.now().year
-    series = series[series.index < current_year]
+    series = (df['Mkt-RF'] + df['RF'] + df['SMB']).loc[start_year:current_year - 1]
 
     return compute_stats(
         "US Small Cap",
@@ -603,34 +1109,10 @@ def fetch_french_small_cap_returns(start_year: int = 1926) -> AssetStats:
 
 def fetch_french_risk_free_rate(start_year: int = 1926) -> AssetStats:
     """Fetch risk-free rate (T-bills) from Fama-French data."""
-    content = fetch_french_csv("F-F_Research_Data_Factors_CSV.zip")
-
-    lines = content.strip().split('\n')
-    annual_data = []
-
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-
-        parts = [p.strip() for p in line.split(',')]
-        if len(parts) >= 5:
-            try:
-                year = int(parts[0])
-                if 1900 <= year <= 2100 and len(parts[0]) == 4:
-                    rf = float(parts[4]) / 100
-                    annual_data.append((year, rf))
-            except (ValueError, IndexError):
-                continue
-
-    series = pd.Series(
-        [v for _, v in annual_data],
-        index=[y for y, _ in annual_data]
-    )
-    series = series[series.index >= start_year]
+    df = _parse_french_annual("F-F_Research_Data_Factors_CSV.zip")
 
     current_year = datetime.now().year
-    series = series[series.index < current_year]
+    series = df['RF'].loc[start_year:current_year - 1]
 
     return compute_stats(
         "T-Bills",
@@ -643,36 +1125,10 @@ def fetch_french_risk_free_rate(start_year: int = 1926) -> AssetStats:
 def fetch_french_international_returns(start_year: int = 1990) -> AssetStats:
     """Fetch developed ex-US market returns."""
     try:
-        content = fetch_french_csv("Developed_ex_US_3_Factors_CSV.zip")
-
-        lines = content.strip().split('\n')
-        annual_data = []
-
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-
-            parts = [p.strip() for p in line.split(',')]
-            if len(parts) >= 5:
-                try:
-                    year = int(parts[0])
-                    if 1900 <= year <= 2100 and len(parts[0]) == 4:
-                        mkt_rf = float(parts[1]) / 100
-                        rf = float(parts[4]) / 100
-                        total_return = mkt_rf + rf
-                        annual_data.append((year, total_return))
-                except (ValueError, IndexError):
-                    continue
-
-        series = pd.Series(
-            [v for _, v in annual_data],
-            index=[y for y, _ in annual_data]
-        )
-        series = series[series.index >= start_year]
+        df = _parse_french_annual("Developed_ex_US_3_Factors_CSV.zip")
 
         current_year = datetime.now().year
-        series = series[series.index < current_year]
+        series = (df['Mkt-RF'] + df['RF']).loc[start_year:current_year - 1]
 
         return compute_stats(
             "International Developed",
@@ -687,46 +1143,20 @@ def fetch_french_international_returns(start_year: int = 1990) -> AssetStats:
 def fetch_french_emerging_returns(start_year: int = 1990) -> AssetStats:
     """Fetch emerging market returns from French data."""
     try:
-        content = fetch_french_csv("Emerging_5_Factors_CSV.zip")
+        df = _parse_french_annual("Emerging_5_Factors_CSV.zip")
 
-        lines = content.strip().split('\n')
-        annual_data = []
+        series = df['Mkt-RF'] + df['RF']
 
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-
-            parts = [p.strip() for p in line.split(',')]
-            if len(parts) >= 6:
-                try:
-                    year = int(parts[0])
-                    if 1900 <= year <= 2100 and len(parts[0]) == 4:
-                        mkt_rf = float(parts[1]) / 100
-                        rf = float(parts[5]) / 100
-                        total_return = mkt_rf + rf
-
-                        # Skip obviously bad data (returns < -90% are suspicious)
-                        if total_return > -0.90:
-                            annual_data.append((year, total_return))
-                except (ValueError, IndexError):
-                    continue
-
-        if not annual_data:
+        # Skip obviously bad data (returns < -90% are suspicious)
+        series = series[series > -0.90]
+        if series.empty:
             raise ValueError("No valid data found")
 
-        series = pd.Series(
-            [v for _, v in annual_data],
-            index=[y for y, _ in annual_data]
-        )
-        series = series[series.index >= start_year]
-
         current_year = datetime.now().year
-        series = series[series.index < current_year]
+        series = series.loc[start_year:current_year - 1]
 
-        # Sanity check: if geometric mean would be negative, data is bad
-        cumulative = np.prod(1 + series.values)
-        if cumulative <= 0:
+        # Sanity check: a year at or below -100% makes the geometric mean invalid
+        if not np.all(series.values > -1):
             raise ValueError("Data produces invalid geometric mean")
 
         return compute_stats(
@@ -747,45 +1177,91 @@ def fetch_french_emerging_returns(start_year: int = 1990) -> AssetStats:
 DAMODARAN_URL = "https://pages.stern.nyu.edu/~adamodar/pc/datasets/histretSP.xls"
 
 
+def _is_xlsx(path: Path) -> bool:
+    """Whether a workbook is xlsx (a ZIP archive) rather than legacy BIFF .xls."""
+    with open(path, 'rb') as f:
+        return f.read(4) == b"PK\x03\x04"
+
+
+def _read_first_sheet_openpyxl(path: Path) -> pd.DataFrame:
+    """
+    Read the first worksheet of an xlsx workbook with openpyxl in read-only mode.
+
+    Read-only mode streams rows instead of building the full workbook DOM,
+    keeping memory close to the file size. The first row is the header.
+    """
+    import openpyxl
+
+    # Pass a file object: openpyxl rejects paths ending in .xls by extension
+    # alone, and the cache names Damodaran's download .xls
+    with open(path, 'rb') as f:
+        wb = openpyxl.load_workbook(f, read_only=True, data_only=True)
+        try:
+            rows = list(wb.worksheets[0].iter_rows(values_only=True))
+        finally:
+            wb.close()  # Read-only workbooks keep the archive open until closed
+
+    if not rows:
+        return pd.DataFrame()
+    return pd.DataFrame(rows[1:], columns=rows[0])
+
+
+@synchronized
+@lru_cache(maxsize=1)
 def fetch_damodaran_data() -> pd.DataFrame:
     """
     Fetch Aswath Damodaran's historical returns dataset.
     Contains S&P 500, T-Bills, T-Bonds, Baa Corporate Bonds, Real Estate, Gold.
+
+    Parsed with the calamine engine when python-calamine is installed; it
+    reads .xls/.xlsx natively and is far faster and leaner than openpyxl.
+    Otherwise xlsx content is streamed with openpyxl and legacy .xls goes
+    through pd.read_excel (which uses xlrd).
+    The download is cached on disk and the parsed frame is memoized, so
+    fetching several Damodaran assets costs one download and one parse.
     """
-    if not HAS_OPENPYXL:
-        raise ImportError("openpyxl required for Damodaran data")
+    if not (HAS_CALAMINE or HAS_OPENPYXL or HAS_XLRD):
+        raise ImportError(
+            "python-calamine (or openpyxl for .xlsx, xlrd for .xls) required "
+            "for Damodaran data. Run: pip install python-calamine"
+        )
 
-    print("  Downloading Damodaran data from NYU Stern...")
+    print("  Fetching Damodaran data from NYU Stern...")
 
-    req = Request(DAMODARAN_URL, headers={'User-Agent': 'Mozilla/5.0'})
-    with urlopen(req, timeout=30) as response:
-        data = response.read()
+    # Download the Excel file (with caching)
+    xls_path = fetch_url_cached_path(DAMODARAN_URL, ".xls", "damodaran")
 
     # Read the main data sheet
-    df = pd.read_excel(
-        io.BytesIO(data),
-        sheet_name=0,  # First sheet
-        skiprows=0,
-    )
+    if HAS_CALAMINE:
+        df = pd.read_excel(xls_path, sheet_name=0, engine="calamine")
+    elif HAS_OPENPYXL and _is_xlsx(xls_path):
+        df = _read_first_sheet_openpyxl(xls_path)
+    else:
+        df = pd.read_excel(xls_path, sheet_name=0)
 
+    # Lowercased column names, computed once for every asset lookup
+    df.attrs['lower_cols'] = {str(col).lower(): col for col in df.columns}
     return df
 
 
+def _tonum(series: pd.Series) -> pd.Series:
+    """Coerce to numeric, skipping the conversion when already numeric."""
+    if pd.api.types.is_numeric_dtype(series):
+        return series
+    return pd.to_numeric(series, errors='coerce')
+
+
 def fetch_damodaran_returns(column_name: str, asset_name: str, description: str, start_year: int = 1928) -> AssetStats:
     """Fetch returns for a specific asset from Damodaran data."""
     df = fetch_damodaran_data()
 
     # Find the year column and the requested data column
     # Damodaran's format varies, so we need to be flexible
-    year_col = None
-    data_col = None
-
-    for col in df.columns:
-        col_str = str(col).lower()
-        if 'year' in col_str:
-            year_col = col
-        if column_name.lower() in col_str:
-            data_col = col
+    # (the last matching column wins)
+    lower_cols = df.attrs['lower_cols']
+    needle = column_name.lower()
+    year_col = next((col for name, col in reversed(lower_cols.items()) if 'year' in name), None)
+    data_col = next((col for name, col in reversed(lower_cols.items()) if needle in name), None)
 
     if year_col is None or data_col is None:
         # Try numeric column indices as fallback
@@ -807,31 +1283,29 @@ def fetch_damodaran_returns(column_name: str, asset_name: str, description: str,
     if year_col is None or data_col is None:
         raise ValueError(f"Could not find column {column_name} in Damodaran data")
 
-    # Extract data
-    df_clean = df[[year_col, data_col]].copy()
-    df_clean.columns = ['Year', 'Return']
-
-    # Clean up - remove non-numeric rows
-    df_clean = df_clean[pd.to_numeric(df_clean['Year'], errors='coerce').notna()]
-    df_clean['Year'] = df_clean['Year'].astype(int)
-    df_clean = df_clean[df_clean['Year'] >= start_year]
+    # Coerce both columns once and filter in a single vectorized pass;
+    # header and note rows become NaN and drop out with the mask
+    current_year = datetime.now().year  # Exclude the current incomplete year
+    years = _tonum(df[year_col]).to_numpy(dtype=np.float64)
+    returns = _tonum(df[data_col]).to_numpy(dtype=np.float64)
+    mask = (np.isfinite(years) & np.isfinite(returns)
+            & (years >= start_year) & (years < current_year))
+    years = years[mask]
+    returns = returns[mask]
+    if len(returns) == 0:
+        raise ValueError(f"No valid returns data for {asset_name}")
 
     # Convert returns (may be percentages or decimals)
-    df_clean['Return'] = pd.to_numeric(df_clean['Return'], errors='coerce')
-    if df_clean['Return'].abs().mean() > 1:  # Likely percentages
-        df_clean['Return'] = df_clean['Return'] / 100
-
-    # Remove current incomplete year
-    current_year = datetime.now().year
-    df_clean = df_clean[df_clean['Year'] < current_year]
-
-    series = pd.Series(df_clean['Return'].values, index=df_clean['Year'].values)
+    if np.abs(returns).mean() > 1:  # Likely percentages
+        returns = returns / 100
 
-    return compute_stats(
+    return compute_array_stats(
         asset_name,
         description,
         "Aswath Damodaran, NYU Stern",
-        series,
+        returns,
+        int(years.min()),
+        int(years.max()),
     )
 
 
@@ -839,30 +1313,104 @@ def fetch_damodaran_returns(column_name: str, asset_name: str, description: str,
 # Yahoo Finance (fallback for recent data)
 # ============================================================================
 
+# Yahoo throttles bursts, so cap concurrent downloads from the fetch pool
+_YAHOO_SLOTS = threading.BoundedSemaphore(3)
+
+
+def _yahoo_download(ticker: str, **kwargs) -> pd.DataFrame:
+    """
+    yf.download() with backoff when Yahoo rate-limits us.
+
+    yfinance doesn't expose response headers, so rate limiting is detected
+    from the error message.
+    """
+    for attempt in range(MAX_ATTEMPTS):
+        try:
+            with _YAHOO_SLOTS:
+                return _yfinance().download(ticker, **kwargs)
+        except Exception as e:
+            if "rate limit" not in str(e).lower() or attempt == MAX_ATTEMPTS - 1:
+                raise
+            delay = backoff_delay(attempt)
+            print(f"    [Yahoo rate limit on {ticker}, retrying in {delay:.1f}s]")
+        time.sleep(delay)
+
+
+def yahoo_cache_key(ticker: str, start_year: int, end_year: int) -> str:
+    """Series cache key for a ticker's annual returns."""
+    return f"yahoo_{ticker}_{start_year}_{end_year}"
+
+
+def _annual_returns_from_prices(prices: pd.Series) -> pd.Series:
+    """Calendar-year returns from a daily close series, indexed by year."""
+    # Last close of each calendar year; grouping on the year directly
+    # skips resample's bin construction and frequency inference
+    year_end_prices = prices.groupby(prices.index.year).last()
+    return year_end_prices.pct_change().dropna()
+
+
+def fetch_yahoo_batch(tickers: dict[str, int], end_year: Optional[int] = None) -> None:
+    """
+    Download several tickers with one yf.download() call and fill their
+    per-ticker caches, so fetch_yahoo_annual_returns() reads them from disk.
+
+    `tickers` maps each symbol to its start year. Tickers that are already
+    cached are skipped; tickers missing from the response are left for
+    the per-ticker fetch to retry and report.
+    """
+    end_year = end_year or datetime.now().year
+    missing = {
+        ticker: start_year for ticker, start_year in tickers.items()
+        if not is_cache_valid(series_cache_path(yahoo_cache_key(ticker, start_year, end_year)))
+    }
+    if not missing:
+        return
+
+    _yfinance()  # Fail before announcing a download if yfinance is missing
+    print(f"    [Downloading {', '.join(missing)} from Yahoo Finance...]")
+    data = _yahoo_download(
+        list(missing),
+        start=f"{min(missing.values())}-01-01",
+        end=f"{end_year + 1}-01-01",
+        progress=False,
+        auto_adjust=True,
+        group_by="ticker",
+        threads=True,
+    )
+
+    for ticker, start_year in missing.items():
+        try:
+            prices = data[ticker]["Close"].dropna()
+        except KeyError:
+            continue
+        prices = prices[prices.index.year >= start_year]
+        if prices.empty:
+            continue
+        save_series_cache(
+            _annual_returns_from_prices(prices),
+            yahoo_cache_key(ticker, start_year, end_year),
+        )
+
+
 def fetch_yahoo_annual_returns(
     ticker: str,
     start_year: int = 1970,
     end_year: Optional[int] = None,
 ) -> pd.Series:
     """Fetch price data from Yahoo Finance and compute annual returns."""
-    if not HAS_YFINANCE:
-        raise ImportError("yfinance is required")
-
     end_year = end_year or datetime.now().year
 
     # Check cache first
-    cache_key = f"yahoo_{ticker}_{start_year}_{end_year}"
-    cache_path = CACHE_DIR / f"{cache_key}.pkl"
-
-    if is_cache_valid(cache_path):
-        print(f"    [Using cached {cache_path.name}]")
-        with open(cache_path, 'rb') as f:
-            return pickle.load(f)
+    cache_key = yahoo_cache_key(ticker, start_year, end_year)
+    cached = load_series_cache(cache_key)
+    if cached is not None:
+        return cached
 
+    _yfinance()
     print(f"    [Downloading {ticker} from Yahoo Finance...]")
 
     # Fetch daily adjusted close prices
-    data = yf.download(
+    data = _yahoo_download(
         ticker,
         start=f"{start_year}-01-01",
         end=f"{end_year + 1}-01-01",
@@ -877,15 +1425,9 @@ def fetch_yahoo_annual_returns(
     if isinstance(prices, pd.DataFrame):
         prices = prices.iloc[:, 0]
 
-    year_end_prices = prices.resample("YE").last()
-    annual_returns = year_end_prices.pct_change().dropna()
-    annual_returns.index = annual_returns.index.year
+    annual_returns = _annual_returns_from_prices(prices)
 
-    # Save to cache
-    CACHE_DIR.mkdir(exist_ok=True)
-    with open(cache_path, 'wb') as f:
-        pickle.dump(annual_returns, f)
-    print(f"    [Cached to {cache_path.name}]")
+    save_series_cache(annual_returns, cache_key)
 
     return annual_returns
 
@@ -894,25 +1436,37 @@ def fetch_yahoo_annual_returns(
 # FRED Data
 # ============================================================================
 
+@lru_cache(maxsize=None)
+def _fred_for_key(api_key: str):
+    """One fredapi client per API key, shared by every FRED series in a run."""
+    from fredapi import Fred
+
+    return Fred(api_key=api_key)
+
+
+def _fred_client(api_key: Optional[str] = None):
+    """Shared fredapi client for an API key (default: FRED_API_KEY)."""
+    if not HAS_FRED:
+        raise ImportError("fredapi is required")
+
+    api_key = api_key or os.environ.get("FRED_API_KEY")
+    if not api_key:
+        raise ValueError(
+            "FRED API key required. Set FRED_API_KEY environment variable "
+            "or pass api_key parameter. Get a free key at: "
+            "https://fred.stlouisfed.org/docs/api/api_key.html"
+        )
+
+    return _fred_for_key(api_key)
+
+
 def fetch_fred_series(
     series_id: str,
     api_key: Optional[str] = None,
     start_year: int = 1970,
 ) -> pd.Series:
     """Fetch data from FRED."""
-    if not HAS_FRED:
-        raise ImportError("fredapi is required")
-
-    if api_key is None:
-        api_key = os.environ.get("FRED_API_KEY")
-        if api_key is None:
-            raise ValueError(
-                "FRED API key required. Set FRED_API_KEY environment variable "
-                "or pass api_key parameter. Get a free key at: "
-                "https://fred.stlouisfed.org/docs/api/api_key.html"
-            )
-
-    fred = Fred(api_key=api_key)
+    fred = _fred_client(api_key)
     data = fred.get_series(series_id, observation_start=f"{start_year}-01-01")
     return data
 
@@ -921,40 +1475,23 @@ def fetch_fred_series(
 # FRED Data Fetchers
 # ============================================================================
 
-def fetch_fred_tbills(start_year: int = 1934) -> AssetStats:
-    """Fetch T-bill returns from FRED (3-Month Treasury Bill rate)."""
-    if not HAS_FRED:
-        raise ImportError("fredapi is required")
-
-    api_key = os.environ.get("FRED_API_KEY")
-    if not api_key:
-        raise ValueError("FRED_API_KEY not set")
-
-    # Check cache
-    cache_key = f"fred_TB3MS_{start_year}"
-    cache_path = CACHE_DIR / f"{cache_key}.pkl"
+@disk_cached(key=lambda fred, start_year: f"fred_TB3MS_{start_year}")
+def _fred_tbills_annual(fred, start_year: int) -> pd.Series:
+    """Download TB3MS and average it per year (decimal)."""
+    print("    [Downloading TB3MS from FRED...]")
 
-    if is_cache_valid(cache_path):
-        print(f"    [Using cached {cache_path.name}]")
-        with open(cache_path, 'rb') as f:
-            annual = pickle.load(f)
-    else:
-        print("    [Downloading TB3MS from FRED...]")
-        fred = Fred(api_key=api_key)
+    # TB3MS: 3-Month Treasury Bill Secondary Market Rate (monthly, percent)
+    data = fred.get_series("TB3MS", observation_start=f"{start_year}-01-01")
 
-        # TB3MS: 3-Month Treasury Bill Secondary Market Rate (monthly, percent)
-        data = fred.get_series("TB3MS", observation_start=f"{start_year}-01-01")
+    # Convert to annual returns (average rate for the year)
+    annual = data.resample("YE").mean() / 100  # Convert percent to decimal
+    annual.index = annual.index.year
+    return annual.dropna()
 
-        # Convert to annual returns (average rate for the year)
-        annual = data.resample("YE").mean() / 100  # Convert percent to decimal
-        annual.index = annual.index.year
-        annual = annual.dropna()
 
-        # Save to cache
-        CACHE_DIR.mkdir(exist_ok=True)
-        with open(cache_path, 'wb') as f:
-            pickle.dump(annual, f)
-        print(f"    [Cached to {cache_path.name}]")
+def fetch_fred_tbills(start_year: int = 1934) -> AssetStats:
+    """Fetch T-bill returns from FRED (3-Month Treasury Bill rate)."""
+    annual = _fred_tbills_annual(_fred_client(), start_year)
 
     # Filter to complete years
     current_year = datetime.now().year
@@ -968,40 +1505,24 @@ def fetch_fred_tbills(start_year: int = 1934) -> AssetStats:
     )
 
 
-def fetch_fred_inflation(start_year: int = 1947) -> AssetStats:
-    """Fetch CPI inflation from FRED."""
-    if not HAS_FRED:
-        raise ImportError("fredapi is required")
+@disk_cached(key=lambda fred, start_year: f"fred_CPIAUCSL_{start_year}")
+def _fred_inflation_annual(fred, start_year: int) -> pd.Series:
+    """Download CPIAUCSL and compute December-to-December inflation."""
+    print("    [Downloading CPIAUCSL from FRED...]")
 
-    api_key = os.environ.get("FRED_API_KEY")
-    if not api_key:
-        raise ValueError("FRED_API_KEY not set")
-
-    # Check cache
-    cache_key = f"fred_CPIAUCSL_{start_year}"
-    cache_path = CACHE_DIR / f"{cache_key}.pkl"
-
-    if is_cache_valid(cache_path):
-        print(f"    [Using cached {cache_path.name}]")
-        with open(cache_path, 'rb') as f:
-            inflation = pickle.load(f)
-    else:
-        print("    [Downloading CPIAUCSL from FRED...]")
-        fred = Fred(api_key=api_key)
+    # CPIAUCSL: Consumer Price Index for All Urban Consumers
+    data = fred.get_series("CPIAUCSL", observation_start=f"{start_year}-01-01")
 
-        # CPIAUCSL: Consumer Price Index for All Urban Consumers
-        data = fred.get_series("CPIAUCSL", observation_start=f"{start_year}-01-01")
+    # Get December value for each year and compute annual inflation
+    year_end = data.resample("YE").last()
+    inflation = year_end.pct_change().dropna()
+    inflation.index = inflation.index.year
+    return inflation
 
-        # Get December value for each year and compute annual inflation
-        year_end = data.resample("YE").last()
-        inflation = year_end.pct_change().dropna()
-        inflation.index = inflation.index.year
 
-        # Save to cache
-        CACHE_DIR.mkdir(exist_ok=True)
-        with open(cache_path, 'wb') as f:
-            pickle.dump(inflation, f)
-        print(f"    [Cached to {cache_path.name}]")
+def fetch_fred_inflation(start_year: int = 1947) -> AssetStats:
+    """Fetch CPI inflation from FRED."""
+    inflation = _fred_inflation_annual(_fred_client(), start_year)
 
     # Filter to complete years
     current_year = datetime.now().year
@@ -1015,52 +1536,29 @@ def fetch_fred_inflation(start_year: int = 1947) -> AssetStats:
     )
 
 
-def fetch_fred_10yr_treasury(start_year: int = 1953) -> AssetStats:
-    """
-    Fetch 10-Year Treasury yield from FRED and estimate total returns.
-    Uses duration-based approximation for price changes.
-    """
-    if not HAS_FRED:
-        raise ImportError("fredapi is required")
-
-    api_key = os.environ.get("FRED_API_KEY")
-    if not api_key:
-        raise ValueError("FRED_API_KEY not set")
+@disk_cached(key=lambda fred, start_year: f"fred_GS10_{start_year}")
+def _fred_10yr_treasury_annual(fred, start_year: int) -> pd.Series:
+    """Download GS10 and estimate annual total returns from yields."""
+    print("    [Downloading GS10 from FRED...]")
 
-    # Check cache
-    cache_key = f"fred_GS10_{start_year}"
-    cache_path = CACHE_DIR / f"{cache_key}.pkl"
+    # GS10: 10-Year Treasury Constant Maturity Rate
+    data = fred.get_series("GS10", observation_start=f"{start_year}-01-01")
 
-    if is_cache_valid(cache_path):
-        print(f"    [Using cached {cache_path.name}]")
-        with open(cache_path, 'rb') as f:
-            total_returns = pickle.load(f)
-    else:
-        print("    [Downloading GS10 from FRED...]")
-        fred = Fred(api_key=api_key)
+    # Get annual average yield
+    yearly = data.resample("YE").mean()
+    yearly.index = yearly.index.year
 
-        # GS10: 10-Year Treasury Constant Maturity Rate
-        data = fred.get_series("GS10", observation_start=f"{start_year}-01-01")
+    # Estimate bond total return using duration approximation
+    # Duration for 10-year bond ≈ 8 years
+    return duration_total_returns(yearly, duration=8.0)
 
-        # Get annual average yield
-        yearly = data.resample("YE").mean()
-        yearly.index = yearly.index.year
 
-        # Estimate bond total return using duration approximation
-        # Duration for 10-year bond ≈ 8 years
-        duration = 8.0
-        yields = yearly / 100  # Convert percent to decimal
-        yield_changes = yields.diff()
-
-        # Total return ≈ starting yield - duration * yield change
-        total_returns = yields.shift(1) - duration * yield_changes
-        total_returns = total_returns.dropna()
-
-        # Save to cache
-        CACHE_DIR.mkdir(exist_ok=True)
-        with open(cache_path, 'wb') as f:
-            pickle.dump(total_returns, f)
-        print(f"    [Cached to {cache_path.name}]")
+def fetch_fred_10yr_treasury(start_year: int = 1953) -> AssetStats:
+    """
+    Fetch 10-Year Treasury yield from FRED and estimate total returns.
+    Uses duration-based approximation for price changes.
+    """
+    total_returns = _fred_10yr_treasury_annual(_fred_client(), start_year)
 
     # Filter to complete years
     current_year = datetime.now().year
@@ -1096,17 +1594,16 @@ def fetch_sp500_best(start_year: int = 1871) -> AssetStats:
         errors.append(f"French: {e}")
 
     # Fall back to Yahoo Finance
-    if HAS_YFINANCE:
-        try:
-            returns = fetch_yahoo_annual_returns("^SP500TR", max(start_year, 1988))
-            return compute_stats(
-                "S&P 500",
-                "US Large Cap Stocks (S&P 500 Total Return)",
-                "Yahoo Finance",
-                returns,
-            )
-        except Exception as e:
-            errors.append(f"Yahoo: {e}")
+    try:
+        returns = fetch_yahoo_annual_returns("^SP500TR", max(start_year, 1988))
+        return compute_stats(
+            "S&P 500",
+            "US Large Cap Stocks (S&P 500 Total Return)",
+            "Yahoo Finance",
+            returns,
+        )
+    except Exception as e:
+        errors.append(f"Yahoo: {e}")
 
     raise ValueError(f"Could not fetch S&P 500 data: {'; '.join(errors)}")
 
@@ -1122,17 +1619,16 @@ def fetch_small_cap_best(start_year: int = 1926) -> AssetStats:
         errors.append(f"French: {e}")
 
     # Fall back to Yahoo Finance
-    if HAS_YFINANCE:
-        try:
-            returns = fetch_yahoo_annual_returns("^RUT", 1988)
-            return compute_stats(
-                "US Small Cap",
-                "US Small Cap Stocks (Russell 2000)",
-                "Yahoo Finance",
-                returns,
-            )
-        except Exception as e:
-            errors.append(f"Yahoo: {e}")
+    try:
+        returns = fetch_yahoo_annual_returns("^RUT", 1988)
+        return compute_stats(
+            "US Small Cap",
+            "US Small Cap Stocks (Russell 2000)",
+            "Yahoo Finance",
+            returns,
+        )
+    except Exception as e:
+        errors.append(f"Yahoo: {e}")
 
     raise ValueError(f"Could not fetch small cap data: {'; '.join(errors)}")
 
@@ -1169,17 +1665,16 @@ def fetch_bonds_best(start_year: int = 1871) -> AssetStats:
             errors.append(f"Shiller: {e}")
 
     # Fall back to Yahoo Finance (TLT ETF)
-    if HAS_YFINANCE:
-        try:
-            returns = fetch_yahoo_annual_returns("TLT", 2002)
-            return compute_stats(
-                "US Long-Term Bonds",
-                "US Long-Term Treasury Bonds (20+ Year via TLT)",
-                "Yahoo Finance",
-                returns,
-            )
-        except Exception as e:
-            errors.append(f"Yahoo: {e}")
+    try:
+        returns = fetch_yahoo_annual_returns("TLT", 2002)
+        return compute_stats(
+            "US Long-Term Bonds",
+            "US Long-Term Treasury Bonds (20+ Year via TLT)",
+            "Yahoo Finance",
+            returns,
+        )
+    except Exception as e:
+        errors.append(f"Yahoo: {e}")
 
     raise ValueError(f"Could not fetch bond data: {'; '.join(errors)}")
 
@@ -1216,17 +1711,16 @@ def fetch_international_best(start_year: int = 1990) -> AssetStats:
         errors.append(f"French: {e}")
 
     # Fall back to Yahoo Finance
-    if HAS_YFINANCE:
-        try:
-            returns = fetch_yahoo_annual_returns("EFA", 2001)
-            return compute_stats(
-                "International Developed",
-                "International Developed Markets (MSCI EAFE via EFA)",
-                "Yahoo Finance",
-                returns,
-            )
-        except Exception as e:
-            errors.append(f"Yahoo: {e}")
+    try:
+        returns = fetch_yahoo_annual_returns("EFA", 2001)
+        return compute_stats(
+            "International Developed",
+            "International Developed Markets (MSCI EAFE via EFA)",
+            "Yahoo Finance",
+            returns,
+        )
+    except Exception as e:
+        errors.append(f"Yahoo: {e}")
 
     raise ValueError(f"Could not fetch international data: {'; '.join(errors)}")
 
@@ -1242,27 +1736,34 @@ def fetch_emerging_best(start_year: int = 1990) -> AssetStats:
         errors.append(f"French: {e}")
 
     # Fall back to Yahoo Finance
-    if HAS_YFINANCE:
-        try:
-            returns = fetch_yahoo_annual_returns("EEM", 2003)
-            return compute_stats(
-                "Emerging Markets",
-                "Emerging Markets (MSCI EM via EEM)",
-                "Yahoo Finance",
-                returns,
-            )
-        except Exception as e:
-            errors.append(f"Yahoo: {e}")
+    try:
+        returns = fetch_yahoo_annual_returns("EEM", 2003)
+        return compute_stats(
+            "Emerging Markets",
+            "Emerging Markets (MSCI EM via EEM)",
+            "Yahoo Finance",
+            returns,
+        )
+    except Exception as e:
+        errors.append(f"Yahoo: {e}")
 
     raise ValueError(f"Could not fetch emerging markets data: {'; '.join(errors)}")
 
 
+# Tickers behind the Yahoo-only asset classes and their start years,
+# downloaded together by fetch_yahoo_batch()
+YAHOO_ASSET_TICKERS = {
+    "VNQ": 2004,
+    "GC=F": 1975,
+    "LQD": 2002,
+    "TIP": 2003,
+    "AGG": 2003,
+}
+
+
 def fetch_reits_yahoo() -> AssetStats:
     """Fetch REIT returns from Yahoo Finance."""
-    if not HAS_YFINANCE:
-        raise ImportError("yfinance is required")
-
-    returns = fetch_yahoo_annual_returns("VNQ", 2004)
+    returns = fetch_yahoo_annual_returns("VNQ", YAHOO_ASSET_TICKERS["VNQ"])
     return compute_stats(
         "REITs",
         "US Real Estate Investment Trusts (via VNQ)",
@@ -1273,10 +1774,7 @@ def fetch_reits_yahoo() -> AssetStats:
 
 def fetch_gold_yahoo() -> AssetStats:
     """Fetch gold returns from Yahoo Finance."""
-    if not HAS_YFINANCE:
-        raise ImportError("yfinance is required")
-
-    returns = fetch_yahoo_annual_returns("GC=F", 1975)
+    returns = fetch_yahoo_annual_returns("GC=F", YAHOO_ASSET_TICKERS["GC=F"])
     return compute_stats(
         "Gold",
         "Gold (via GC=F futures)",
@@ -1287,10 +1785,7 @@ def fetch_gold_yahoo() -> AssetStats:
 
 def fetch_corporate_bonds_yahoo() -> AssetStats:
     """Fetch corporate bond returns from Yahoo Finance."""
-    if not HAS_YFINANCE:
-        raise ImportError("yfinance is required")
-
-    returns = fetch_yahoo_annual_returns("LQD", 2002)
+    returns = fetch_yahoo_annual_returns("LQD", YAHOO_ASSET_TICKERS["LQD"])
     return compute_stats(
         "US Corporate Bonds",
         "US Investment Grade Corporate Bonds (via LQD)",
@@ -1301,10 +1796,7 @@ def fetch_corporate_bonds_yahoo() -> AssetStats:
 
 def fetch_tips_yahoo() -> AssetStats:
     """Fetch TIPS returns from Yahoo Finance."""
-    if not HAS_YFINANCE:
-        raise ImportError("yfinance is required")
-
-    returns = fetch_yahoo_annual_returns("TIP", 2003)
+    returns = fetch_yahoo_annual_returns("TIP", YAHOO_ASSET_TICKERS["TIP"])
     return compute_stats(
         "TIPS",
         "US Treasury Inflation-Protected Securities (via TIP)",
@@ -1315,10 +1807,7 @@ def fetch_tips_yahoo() -> AssetStats:
 
 def fetch_aggregate_bonds_yahoo() -> AssetStats:
     """Fetch aggregate bond returns from Yahoo Finance."""
-    if not HAS_YFINANCE:
-        raise ImportError("yfinance is required")
-
-    returns = fetch_yahoo_annual_returns("AGG", 2003)
+    returns = fetch_yahoo_annual_returns("AGG", YAHOO_ASSET_TICKERS["AGG"])
     return compute_stats(
         "US Aggregate Bond",
         "US Investment Grade Bonds (Bloomberg Aggregate via AGG)",
@@ -1327,10 +1816,64 @@ def fetch_aggregate_bonds_yahoo() -> AssetStats:
     )
 
 
+# ============================================================================
+# Prefetching
+# ============================================================================
+
+# Raw files read by the Shiller and French fetchers. They come from
+# independent hosts, so downloading them concurrently overlaps network I/O;
+# the fetchers then hit the warm cache.
+PREFETCH_SOURCES = [
+    (SHILLER_DATA_URL, ".xls", "shiller"),
+    (f"{FRENCH_BASE_URL}F-F_Research_Data_Factors_CSV.zip", ".zip", "french"),
+    (f"{FRENCH_BASE_URL}Developed_ex_US_3_Factors_CSV.zip", ".zip", "french"),
+    (f"{FRENCH_BASE_URL}Emerging_5_Factors_CSV.zip", ".zip", "french"),
+]
+
+
+def _prefetch_one(entry: tuple[str, str, str]) -> None:
+    url, suffix, source = entry
+    try:
+        fetch_url_cached_path(url, suffix, source)
+    except Exception as e:
+        # The fetcher will retry and report the error in context
+        print(f"    [Prefetch failed for {url[:50]}...: {e}]")
+
+
+def prefetch_sources(max_workers: int = 8) -> ThreadPoolExecutor:
+    """
+    Start warming the download cache for all raw data files in the background.
+
+    Returns without waiting. A fetcher that needs a file still in flight
+    blocks on its per-URL lock and then reads the cached copy instead of
+    downloading it again.
+    """
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    for entry in PREFETCH_SOURCES:
+        executor.submit(_prefetch_one, entry)
+    executor.shutdown(wait=False)
+    return executor
+
+
 # ============================================================================
 # Output Formatters
 # ============================================================================
 
+def dump_json(obj) -> bytes:
+    """
+    Serialize obj as indented JSON, with orjson's C encoder when installed.
+
+    The output is equivalent across installs, not byte-identical: orjson
+    writes e.g. 1e-05 as 0.00001 and non-ASCII text as raw UTF-8 rather
+    than \\u escapes, and NaN (e.g. skewness of a very short series) as
+    null where json.dumps writes the non-standard NaN.
+    """
+    if HAS_ORJSON:
+        import orjson
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, indent=2).encode()
+
+
 def compute_student_t_scale(std_dev: float, df: float = 5.0) -> float:
     """
     Compute the scale parameter for Student's t distribution.
@@ -1344,56 +1887,74 @@ def compute_student_t_scale(std_dev: float, df: float = 5.0) -> float:
     return std_dev * np.sqrt((df - 2) / df)
 
 
+# Templates for format_rust_const(), filled in with one format_map() call
+RUST_CONST_TEMPLATE = """\
+    // {description}
+    // Source: {source}
+    // Data: {start_year}-{end_year} ({num_years} years)
+    // Arithmetic mean: {arithmetic_mean:.4f}, Geometric mean: {geometric_mean:.4f}
+    // Std dev: {std_dev:.4f}, Skewness: {skewness:.2f}, Kurtosis: {kurtosis:.2f}
+    pub const {rust_name}_HISTORICAL_FIXED: ReturnProfile = ReturnProfile::Fixed({geometric_mean:.6});
+    pub const {rust_name}_HISTORICAL_NORMAL: ReturnProfile = ReturnProfile::Normal {{
+        mean: {arithmetic_mean:.6},
+        std_dev: {std_dev:.6},
+    }};"""
+
+RUST_LOGNORMAL_TEMPLATE = """\
+    pub const {rust_name}_HISTORICAL_LOGNORMAL: ReturnProfile = ReturnProfile::LogNormal {{
+        mean: {arithmetic_mean:.6},
+        std_dev: {std_dev:.6},
+    }};"""
+
+RUST_STUDENT_T_TEMPLATE = """\
+    pub const {rust_name}_HISTORICAL_STUDENT_T: ReturnProfile = ReturnProfile::StudentT {{
+        mean: {arithmetic_mean:.6},
+        scale: {scale:.6},
+        df: {df},
+    }};"""
+
+
+@lru_cache(maxsize=64)
 def format_rust_const(stats: AssetStats, const_prefix: str) -> str:
     """Format statistics as Rust const definitions."""
-    rust_name = const_prefix.upper().replace(" ", "_").replace("-", "_")
-
-    lines = [
-        f"    // {stats.description}",
-        f"    // Source: {stats.source}",
-        f"    // Data: {stats.start_year}-{stats.end_year} ({stats.num_years} years)",
-        f"    // Arithmetic mean: {stats.arithmetic_mean:.4f}, Geometric mean: {stats.geometric_mean:.4f}",
-        f"    // Std dev: {stats.std_dev:.4f}, Skewness: {stats.skewness:.2f}, Kurtosis: {stats.kurtosis:.2f}",
-        f"    pub const {rust_name}_HISTORICAL_FIXED: ReturnProfile = ReturnProfile::Fixed({stats.geometric_mean:.6});",
-        f"    pub const {rust_name}_HISTORICAL_NORMAL: ReturnProfile = ReturnProfile::Normal {{",
-        f"        mean: {stats.arithmetic_mean:.6},",
-        f"        std_dev: {stats.std_dev:.6},",
-        f"    }};",
-    ]
+    fields = stats.to_dict()
+    fields["rust_name"] = const_prefix.upper().replace(" ", "_").replace("-", "_")
+    templates = [RUST_CONST_TEMPLATE]
 
     # Add LogNormal if appropriate
     if stats.arithmetic_mean > 0 and stats.std_dev < stats.arithmetic_mean * 3:
-        lines.extend([
-            f"    pub const {rust_name}_HISTORICAL_LOGNORMAL: ReturnProfile = ReturnProfile::LogNormal {{",
-            f"        mean: {stats.arithmetic_mean:.6},",
-            f"        std_dev: {stats.std_dev:.6},",
-            f"    }};",
-        ])
+        templates.append(RUST_LOGNORMAL_TEMPLATE)
 
     # Add Student's t for equity-like assets (std_dev > 5%)
     # Student's t with df=5 captures fat tails better than Normal
     if stats.std_dev > 0.05:
         df = 5.0
-        scale = compute_student_t_scale(stats.std_dev, df)
-        lines.extend([
-            f"    pub const {rust_name}_HISTORICAL_STUDENT_T: ReturnProfile = ReturnProfile::StudentT {{",
-            f"        mean: {stats.arithmetic_mean:.6},",
-            f"        scale: {scale:.6},",
-            f"        df: {df},",
-            f"    }};",
-        ])
+        fields["df"] = df
+        fields["scale"] = compute_student_t_scale(stats.std_dev, df)
+        templates.append(RUST_STUDENT_T_TEMPLATE)
 
-    return "\n".join(lines)
+    return "\n".join(templates).format_map(fields)
+
+
+def format_rust_array_body(values, per_line: int = 8) -> str:
+    """
+    Format values as the body of a Rust f64 array literal, per_line per row.
+
+    All values are formatted in one np.char.mod call rather than one
+    f-string per element.
+    """
+    strs = np.char.mod("%.4f", np.asarray(values, dtype=np.float64)).tolist()
+    return ",\n        ".join(
+        ", ".join(strs[i:i + per_line])
+        for i in range(0, len(strs), per_line)
+    )
 
 
 def format_rust_historical_returns(stats: AssetStats, const_prefix: str) -> str:
     """Format historical returns as Rust array for bootstrap sampling."""
     rust_name = const_prefix.upper().replace(" ", "_").replace("-", "_")
 
-    returns_str = ",\n        ".join(
-        ", ".join(f"{r:.4f}" for r in stats.annual_returns[i:i+8])
-        for i in range(0, len(stats.annual_returns), 8)
-    )
+    returns_str = format_rust_array_body(stats.annual_returns)
 
     lines = [
         f"    /// {stats.description}",
@@ -1427,10 +1988,7 @@ def format_inflation_rust_const(stats: AssetStats) -> str:
 def format_inflation_rust_array(stats: AssetStats) -> str:
     """Format historical inflation rates as Rust array for bootstrap sampling."""
     # Format compactly with 8 values per line (same as returns arrays)
-    returns_str = ",\n        ".join(
-        ", ".join(f"{r:.4f}" for r in stats.annual_returns[i:i+8])
-        for i in range(0, len(stats.annual_returns), 8)
-    )
+    returns_str = format_rust_array_body(stats.annual_returns)
 
     lines = [
         f"    /// {stats.description}",
@@ -1445,11 +2003,178 @@ def format_inflation_rust_array(stats: AssetStats) -> str:
     return "\n".join(lines)
 
 
+CSV_HEADER = "name,source,start_year,end_year,arithmetic_mean,geometric_mean,std_dev,skewness,kurtosis"
+
+
+def format_csv_rows(rows: dict[str, AssetStats]) -> list[str]:
+    """
+    Format stats as CSV rows (without the header), one per prefix.
+
+    The moments of all rows are formatted with two np.char.mod calls
+    rather than five f-string conversions per row.
+    """
+    moments = np.array(
+        [[stats.arithmetic_mean, stats.geometric_mean, stats.std_dev,
+          stats.skewness, stats.kurtosis] for stats in rows.values()],
+        dtype=np.float64,
+    ).reshape(-1, 5)
+    means = np.char.mod("%.6f", moments[:, :3]).tolist()
+    shapes = np.char.mod("%.4f", moments[:, 3:]).tolist()
+    return [
+        f"{prefix},{stats.source},{stats.start_year},{stats.end_year},"
+        f"{','.join(mean)},{','.join(shape)}"
+        for (prefix, stats), mean, shape in zip(rows.items(), means, shapes)
+    ]
+
+
+# Progress lines for fetched stats, filled in with one format_map() call
+DISPLAY_ROW_TEMPLATE = (
+    "  ✓ {cached}{start_year}-{end_year} ({num_years} years): "
+    "mean={arithmetic_mean:.2%}, geo={geometric_mean:.2%}, std={std_dev:.2%}\n"
+    "    Source: {source}"
+)
+
+INFLATION_ROW_TEMPLATE = (
+    "  ✓ {cached}{start_year}-{end_year} ({num_years} years): "
+    "mean={arithmetic_mean:.2%}, std={std_dev:.2%}\n"
+    "    Source: {source}"
+)
+
+
+def display_row(stats: AssetStats, cached: bool = False,
+                template: str = DISPLAY_ROW_TEMPLATE) -> str:
+    """Progress line for a fetched (or cached) asset's stats."""
+    fields = stats.to_dict()
+    fields["cached"] = "(cache) " if cached else ""
+    return template.format_map(fields)
+
+
+def format_summary_table(all_stats: dict[str, AssetStats],
+                         inflation: Optional[AssetStats] = None) -> str:
+    """All fetched stats as one aligned table, rendered by DataFrame.to_string()."""
+    rows = {**all_stats, "INFLATION": inflation} if inflation else all_stats
+    df = pd.DataFrame(
+        [stats.to_dict() for stats in rows.values()],
+        index=list(rows),
+        columns=["start_year", "end_year", "arithmetic_mean", "geometric_mean",
+                 "std_dev", "skewness", "kurtosis"],
+    )
+    percent = "{:.2%}".format
+    ratio = "{:.2f}".format
+    return df.to_string(formatters={
+        "arithmetic_mean": percent,
+        "geometric_mean": percent,
+        "std_dev": percent,
+        "skewness": ratio,
+        "kurtosis": ratio,
+    })
+
+
 # ============================================================================
 # Main
 # ============================================================================
 
-def main():
+@contextmanager
+def pinned_cpus(enabled: bool = True):
+    """
+    Pin the calling (main) thread to the lower half of its allowed CPUs
+    (by CPU number) for the duration, restoring its original affinity on
+    exit.
+
+    On Linux the affinity is per thread: threads that are already running
+    (e.g. a background prefetch) keep their mask, and only threads started
+    inside the block inherit the narrower one. The choice of CPUs does not
+    follow NUMA node or core topology. A no-op where
+    os.sched_setaffinity isn't available (macOS, Windows), when the kernel
+    rejects the mask, or when disabled.
+    """
+    if not enabled or not hasattr(os, "sched_setaffinity"):
+        yield
+        return
+
+    allowed = os.sched_getaffinity(0)
+    try:
+        os.sched_setaffinity(0, sorted(allowed)[:max(1, len(allowed) // 2)])
+    except OSError:
+        yield
+        return
+    try:
+        yield
+    finally:
+        os.sched_setaffinity(0, allowed)
+
+
+def fetch_all(fetchers, yahoo_fetchers, start_year: int,
+              all_stats: dict[str, AssetStats]) -> Optional[AssetStats]:
+    """
+    Run the asset fetchers and inflation, printing each result in order.
+
+    Successful stats are added to all_stats by prefix; returns the
+    inflation stats, or None if that fetch failed.
+    """
+    # Sources are independent and mostly network-bound, so fetch them (and
+    # inflation) concurrently and report the results in the original order
+    with ThreadPoolExecutor(max_workers=len(fetchers) + len(yahoo_fetchers) + 1) as executor:
+        futures = [(prefix, name, executor.submit(fetcher))
+                   for prefix, name, fetcher in fetchers]
+        inflation_future = executor.submit(fetch_inflation_best, start_year)
+
+        # One batched Yahoo request for all the ETFs while the core fetchers
+        # run; their fetchers then read the per-ticker caches
+        if HAS_YFINANCE and yahoo_fetchers:
+            try:
+                fetch_yahoo_batch(YAHOO_ASSET_TICKERS)
+            except Exception as e:
+                print(f"    [Yahoo batch download failed, fetching per ticker: {e}]")
+        futures.extend((prefix, name, executor.submit(fetcher))
+                       for prefix, name, fetcher in yahoo_fetchers)
+
+        # Report each result as soon as it and those before it are done;
+        # download logs from the workers may still appear in between
+        for prefix, name, future in futures:
+            error = future.exception()  # Waits for the fetcher without raising
+            print(f"{name}:")
+            if error is None:
+                all_stats[prefix] = future.result()
+                print(display_row(all_stats[prefix]))
+            else:
+                print(f"  ✗ ERROR: {error}")
+            print()
+
+        inflation_stats = None
+        error = inflation_future.exception()
+        print("Inflation:")
+        if error is None:
+            inflation_stats = inflation_future.result()
+            print(display_row(inflation_stats, template=INFLATION_ROW_TEMPLATE))
+        else:
+            print(f"  ✗ ERROR: {error}")
+        print()
+
+    return inflation_stats
+
+
+# Option values for a bare invocation; the parser uses the same defaults,
+# so main() can skip building it when there are no arguments
+DEFAULT_ARGS = {
+    "fred_api_key": None,
+    "output": "rust",
+    "include_returns": False,
+    "start_year": 1926,
+    "clear_cache": None,
+    "cache_days": None,
+}
+
+
+def build_parser():
+    """
+    The command-line parser.
+
+    argparse is imported here rather than at the top so that importing this
+    module (e.g. to call the fetchers directly) doesn't pay for it.
+    """
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Fetch historical return data and generate Rust constants",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -1474,7 +2199,7 @@ Examples:
     parser.add_argument(
         "--output",
         choices=["rust", "json", "csv"],
-        default="rust",
+        default=DEFAULT_ARGS["output"],
         help="Output format (default: rust)",
     )
     parser.add_argument(
@@ -1485,38 +2210,57 @@ Examples:
     parser.add_argument(
         "--start-year",
         type=int,
-        default=1926,
+        default=DEFAULT_ARGS["start_year"],
         help="Start year for data (default: 1926, min for long history: 1871)",
     )
     parser.add_argument(
         "--clear-cache",
-        action="store_true",
-        help="Clear cached data and re-download everything",
+        nargs="?",
+        const="*",
+        metavar="GLOB",
+        help="Clear cached files matching GLOB (e.g. 'yahoo_*'), "
+             "or everything if no pattern is given",
     )
     parser.add_argument(
         "--cache-days",
         type=int,
-        default=7,
-        help="Cache validity in days (default: 7)",
+        default=DEFAULT_ARGS["cache_days"],
+        help="Cache validity in days for every source "
+             "(default: per source, 1 for Yahoo up to 30 for academic data)",
     )
-    args = parser.parse_args()
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+    # The default run is the common one; don't construct argparse for it
+    args = build_parser().parse_args(argv) if argv else SimpleNamespace(**DEFAULT_ARGS)
 
     # Handle cache clearing
-    global CACHE_MAX_AGE_DAYS
-    CACHE_MAX_AGE_DAYS = args.cache_days
+    global CACHE_DAYS_OVERRIDE
+    CACHE_DAYS_OVERRIDE = args.cache_days
 
     if args.clear_cache:
-        import shutil
-        if CACHE_DIR.exists():
-            shutil.rmtree(CACHE_DIR)
-            print(f"Cleared cache directory: {CACHE_DIR}")
+        count = clear_cache(args.clear_cache)
+        print(f"Cleared {count} cached file(s) matching '{args.clear_cache}' in {CACHE_DIR}")
         print()
 
     # Load environment variables from .env file
     load_dotenv()
 
     # Use FRED API key from args, env var, or .env file
-    fred_api_key = args.fred_api_key or os.environ.get("FRED_API_KEY")
+    if args.fred_api_key:
+        os.environ["FRED_API_KEY"] = args.fred_api_key
+
+    # Warm runs: when the last complete run is still fresh, reuse its
+    # results and skip the fetchers (and their downloads and imports)
+    snapshot_path = results_snapshot_path(args.start_year)
+    snapshot = None if args.clear_cache else load_results_snapshot(snapshot_path)
+
+    # Otherwise start the raw downloads now so they overlap the remaining setup
+    if snapshot is None:
+        prefetch_sources()
 
     print("=" * 70)
     print("Historical Returns Data Fetcher")
@@ -1524,7 +2268,7 @@ Examples:
     print("=" * 70)
     print()
 
-    all_stats: list[tuple[str, AssetStats]] = []
+    all_stats: dict[str, AssetStats] = {}
 
     # Core asset classes with long history
     fetchers = [
@@ -1536,9 +2280,11 @@ Examples:
         ("EMERGING_MARKETS", "Emerging Markets", lambda: fetch_emerging_best(1990)),
     ]
 
-    # Additional asset classes (Yahoo Finance)
+    # Additional asset classes (Yahoo Finance). yfinance itself is only
+    # imported once one of these actually has to download
+    yahoo_fetchers = []
     if HAS_YFINANCE:
-        fetchers.extend([
+        yahoo_fetchers.extend([
             ("REITS", "REITs", fetch_reits_yahoo),
             ("GOLD", "Gold", fetch_gold_yahoo),
             ("US_AGG_BOND", "Aggregate Bonds", fetch_aggregate_bonds_yahoo),
@@ -1546,100 +2292,121 @@ Examples:
             ("TIPS", "TIPS", fetch_tips_yahoo),
         ])
 
-    for prefix, name, fetcher in fetchers:
-        try:
-            print(f"Fetching {name}...")
-            stats = fetcher()
-            all_stats.append((prefix, stats))
-            print(f"  ✓ {stats.start_year}-{stats.end_year} ({stats.num_years} years): "
-                  f"mean={stats.arithmetic_mean:.2%}, geo={stats.geometric_mean:.2%}, "
-                  f"std={stats.std_dev:.2%}")
-            print(f"    Source: {stats.source}")
-        except Exception as e:
-            print(f"  ✗ ERROR: {e}")
+    if snapshot is not None:
+        cached_results, inflation_stats = snapshot
+        for prefix, name, stats in cached_results:
+            all_stats[prefix] = stats
+            print(f"{name}:")
+            print(display_row(stats, cached=True))
+            print()
+        print("Inflation:")
+        print(display_row(inflation_stats, cached=True, template=INFLATION_ROW_TEMPLATE))
         print()
+    else:
+        inflation_stats = fetch_all(fetchers, yahoo_fetchers, args.start_year, all_stats)
+
+        # Only snapshot complete runs, so failed sources are retried next time
+        if inflation_stats and len(all_stats) == len(fetchers) + len(yahoo_fetchers):
+            names = {prefix: name for prefix, name, _ in fetchers + yahoo_fetchers}
+            save_results_snapshot(
+                snapshot_path,
+                [(prefix, names[prefix], stats) for prefix, stats in all_stats.items()],
+                inflation_stats,
+            )
 
-    # Fetch inflation
-    inflation_stats = None
-    try:
-        print("Fetching Inflation...")
-        inflation_stats = fetch_inflation_best(args.start_year)
-        print(f"  ✓ {inflation_stats.start_year}-{inflation_stats.end_year} ({inflation_stats.num_years} years): "
-              f"mean={inflation_stats.arithmetic_mean:.2%}, std={inflation_stats.std_dev:.2%}")
-        print(f"    Source: {inflation_stats.source}")
-    except Exception as e:
-        print(f"  ✗ ERROR: {e}")
-    print()
+    if all_stats:
+        print(format_summary_table(all_stats, inflation_stats))
+        print()
+
+    # Keep the cache under CACHE_MAX_BYTES (from the environment or .env),
+    # evicting least recently used files first
+    max_bytes = os.environ.get("CACHE_MAX_BYTES")
+    if max_bytes:
+        evict_cache(int(max_bytes))
 
     print("=" * 70)
     print("OUTPUT")
     print("=" * 70)
     print()
 
-    if args.output == "json":
-        output = {
-            "generated_at": datetime.now().isoformat(),
-            "sources": [
-                "Robert Shiller, Yale University",
-                "Kenneth French Data Library, Dartmouth",
-                "Yahoo Finance",
-            ],
-            "return_profiles": {prefix: stats.to_dict() for prefix, stats in all_stats},
-        }
-        if inflation_stats:
-            output["inflation"] = inflation_stats.to_dict()
-        print(json.dumps(output, indent=2))
-
-    elif args.output == "csv":
-        print("name,source,start_year,end_year,arithmetic_mean,geometric_mean,std_dev,skewness,kurtosis")
-        for prefix, stats in all_stats:
-            print(f"{prefix},{stats.source},{stats.start_year},{stats.end_year},"
-                  f"{stats.arithmetic_mean:.6f},{stats.geometric_mean:.6f},"
-                  f"{stats.std_dev:.6f},{stats.skewness:.4f},{stats.kurtosis:.4f}")
-        if inflation_stats:
-            print(f"INFLATION,{inflation_stats.source},{inflation_stats.start_year},{inflation_stats.end_year},"
-                  f"{inflation_stats.arithmetic_mean:.6f},{inflation_stats.geometric_mean:.6f},"
-                  f"{inflation_stats.std_dev:.6f},{inflation_stats.skewness:.4f},{inflation_stats.kurtosis:.4f}")
-
-    else:  # rust
-        print("// Auto-generated by scripts/fetch_historical_returns.py")
-        print(f"// Generated: {datetime.now().isoformat()}")
-        print("// ")
-        print("// Data Sources:")
-        print("//   - Robert Shiller, Yale University (S&P 500 since 1871)")
-        print("//   - Kenneth French Data Library, Dartmouth (Fama-French factors since 1926)")
-        print("//   - Yahoo Finance (ETF data for recent history)")
-        print()
-        print("impl ReturnProfile {")
-        for prefix, stats in all_stats:
-            print(format_rust_const(stats, prefix))
-            print()
-        print("}")
-
-        if args.include_returns:
-            print()
-            print("/// Historical annual returns for bootstrap sampling")
-            print("pub mod historical_returns {")
-            for prefix, stats in all_stats:
-                print(format_rust_historical_returns(stats, prefix))
-                print()
-            print("}")
-
-        if inflation_stats:
-            print()
-            print("impl InflationProfile {")
-            print(format_inflation_rust_const(inflation_stats))
-            print("}")
+    # Formatting the returns arrays is the CPU-bound tail of the run;
+    # keep it on a narrower set of CPUs
+    with pinned_cpus(args.include_returns):
+        if args.output == "json":
+            output = {
+                "generated_at": datetime.now().isoformat(),
+                "sources": [
+                    "Robert Shiller, Yale University",
+                    "Kenneth French Data Library, Dartmouth",
+                    "Yahoo Finance",
+                ],
+                "return_profiles": {
+                    prefix: stats.to_dict(args.include_returns) for prefix, stats in all_stats.items()
+                },
+            }
+            if inflation_stats:
+                output["inflation"] = inflation_stats.to_dict(args.include_returns)
+            sys.stdout.flush()
+            sys.stdout.buffer.write(dump_json(output) + b"\n")
+
+        elif args.output == "csv":
+            # Build the whole output and write it once rather than per line
+            rows = {**all_stats, "INFLATION": inflation_stats} if inflation_stats else all_stats
+            out = [CSV_HEADER, *format_csv_rows(rows)]
+            out.append("")
+            sys.stdout.write("\n".join(out))
+
+        else:  # rust
+            # Format each asset's consts and (optionally) returns array in one
+            # pass, then assemble the sections and write them once. Serial on
+            # purpose: all assets take ~1.5 ms, less than starting a process
+            # pool (~10 ms with fork) that would also re-import this module
+            const_blocks = []
+            returns_blocks = []
+            for prefix, stats in all_stats.items():
+                const_blocks.append(format_rust_const(stats, prefix) + "\n")
+                if args.include_returns:
+                    returns_blocks.append(format_rust_historical_returns(stats, prefix) + "\n")
+
+            out = [
+                "// Auto-generated by scripts/fetch_historical_returns.py",
+                f"// Generated: {datetime.now().isoformat()}",
+                "// ",
+                "// Data Sources:",
+                "//   - Robert Shiller, Yale University (S&P 500 since 1871)",
+                "//   - Kenneth French Data Library, Dartmouth (Fama-French factors since 1926)",
+                "//   - Yahoo Finance (ETF data for recent history)",
+                "",
+                "impl ReturnProfile {",
+            ]
+            out.extend(const_blocks)
+            out.append("}")
 
             if args.include_returns:
-                print()
-                print("/// Historical annual inflation rates for bootstrap sampling")
-                print("pub mod historical_inflation {")
-                print(format_inflation_rust_array(inflation_stats))
-                print("}")
+                out.append("")
+                out.append("/// Historical annual returns for bootstrap sampling")
+                out.append("pub mod historical_returns {")
+                out.extend(returns_blocks)
+                out.append("}")
+
+            if inflation_stats:
+                out.append("")
+                out.append("impl InflationProfile {")
+                out.append(format_inflation_rust_const(inflation_stats))
+                out.append("}")
+
+                if args.include_returns:
+                    out.append("")
+                    out.append("/// Historical annual inflation rates for bootstrap sampling")
+                    out.append("pub mod historical_inflation {")
+                    out.append(format_inflation_rust_array(inflation_stats))
+                    out.append("}")
+
+            out.append("")
+            sys.stdout.write("\n".join(out))
 
     return 0
 
 
 if __name__ == "__main__":
-    exit(main())
+    raise SystemExit(main())